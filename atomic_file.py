@@ -0,0 +1,56 @@
+import os
+import tempfile
+
+
+# Write a file so readers only ever see the old or the complete new version:
+# the content goes to a temp file in the same folder, is fsynced, then
+# renamed over the target. Call discard() to drop the new content instead.
+class AtomicFile:
+    def __init__(self, path, mode="w", encoding="utf-8", buffering=-1):
+        self.path = path
+        self.mode = mode
+        self.encoding = None if "b" in mode else encoding
+        # Write "\n" as is on every platform, so the bytes on disk are the
+        # bytes the change checks hashed or compared
+        self.newline = None if "b" in mode else "\n"
+        self.buffering = buffering
+        self.discarded = False
+
+    def __enter__(self):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, self.tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix="-" + os.path.basename(self.path))
+        self.file = os.fdopen(fd, self.mode, encoding=self.encoding, newline=self.newline, buffering=self.buffering)
+        return self
+
+    def write(self, data):
+        return self.file.write(data)
+
+    def writelines(self, lines):
+        self.file.writelines(lines)
+
+    def discard(self):
+        self.discarded = True
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None and not self.discarded:
+                self.file.flush()
+                os.fsync(self.file.fileno())
+            self.file.close()
+        except BaseException:
+            os.remove(self.tmp_path)
+            raise
+
+        if exc_type is not None or self.discarded:
+            os.remove(self.tmp_path)
+            return False
+
+        # mkstemp files are private; keep the old file's mode or use 644
+        try:
+            mode = os.stat(self.path).st_mode & 0o777
+        except OSError:
+            mode = 0o644
+        os.chmod(self.tmp_path, mode)
+
+        os.replace(self.tmp_path, self.path)
+        return False
@@ -0,0 +1,54 @@
+import gzip
+import sys
+import time
+import tracemalloc
+
+from stats_parser import parse_teams_and_wins, parse_teams_and_wins_full
+
+# Usage: python bench_parse.py <saved school-stats page> [repeats]
+
+
+def measure(parse, content, repeats):
+    tracemalloc.start()
+    result = parse(content)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for _ in range(repeats):
+        parse(content)
+    elapsed = (time.perf_counter() - start) / repeats
+
+    return result, elapsed, peak
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python bench_parse.py <saved page> [repeats]")
+        sys.exit(1)
+
+    # Saved pages and bench_fixtures/ pages may be gzipped
+    opener = gzip.open if sys.argv[1].endswith(".gz") else open
+    with opener(sys.argv[1], "rb") as f:
+        content = f.read()
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    print(f"Page size: {len(content) / 1024:.0f} KB, {repeats} repeats")
+
+    results = {}
+    for name, parse in [("full tree", parse_teams_and_wins_full), ("table only", parse_teams_and_wins)]:
+        result, elapsed, peak = measure(parse, content, repeats)
+        results[name] = result
+        print(f"{name:>10}: {elapsed * 1000:8.1f} ms/parse, peak {peak / 1024 / 1024:6.1f} MB, {len(result)} schools")
+
+    if not all(results.values()):
+        print("WARNING: no standings found in the page!")
+        sys.exit(1)
+
+    if results["full tree"] != results["table only"]:
+        print("WARNING: extractors disagree on the parsed standings!")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from render import HTML_TEMPLATE, generate_html_output
+from synthetic_league import synthetic_league
+
+# Usage: python bench_render.py [owners ...]
+# Compares the streaming renderer with the old build-one-big-string approach.
+
+TIMESTAMP = "2026-01-01 00:00:00"
+
+
+# The original generate_html_output(): += string building, then .format()
+def render_with_strings(owner_teams, owner_totals, owner_names, output_path):
+    sorted_owners = sorted(owner_totals.items(), key=lambda x: x[1], reverse=True)
+    place_labels = {0: "1st", 1: "2nd", 2: "3rd"}
+
+    team_values = []
+    low_cost_teams = []
+    for owner, teams in owner_teams.items():
+        for team_name, wins, cost in teams:
+            team_values.append((owner, team_name, wins, cost, wins - cost))
+            if cost <= 1:
+                low_cost_teams.append((owner, team_name, wins, cost))
+    team_values = sorted(team_values, key=lambda x: x[4], reverse=True)[:5]
+    low_cost_teams = sorted(low_cost_teams, key=lambda x: x[2], reverse=True)[:5]
+
+    value_rows = ""
+    for owner, team_name, wins, cost, value in team_values:
+        value_rows += f"<tr><td>{owner_names[owner]}</td><td>{team_name}</td><td>{wins}</td><td>{cost:.2f}</td><td>{value:.2f}</td></tr>"
+
+    low_cost_rows = ""
+    for owner, team_name, wins, cost in low_cost_teams:
+        low_cost_rows += f"<tr><td>{owner_names[owner]}</td><td>{team_name}</td><td>{wins}</td><td>{cost:.2f}</td></tr>"
+
+    ranking_rows = ""
+    for owner, total_points in sorted_owners:
+        ranking_rows += f"<tr><td>{owner_names[owner]}</td><td>{total_points}</td></tr>"
+
+    owner_tables = ""
+    owner_counter = 0
+    for i, (owner, _) in enumerate(sorted_owners):
+        teams = owner_teams[owner]
+        total_points = sum([team[1] for team in teams])
+        place = f" ({place_labels[i]})" if i in place_labels else ""
+
+        owner_table = f"<table><caption><h2>{owner_names[owner]}{place}</h2></caption>"
+        owner_table += "<tr><th>Teams</th><th>Points</th><th>Cost</th></tr>"
+        for team_name, points, cost in teams:
+            owner_table += f"<tr><td class='team-col'>{team_name}</td><td class='points-col'>{points}</td><td class='cost-col'>{cost}</td></tr>"
+        owner_table += f"<tr><td>Total</td><td>{str(total_points)[:3]}</td><td>-</td></tr>"
+        owner_table += "</table>"
+
+        if owner_counter % 3 == 0:
+            owner_tables += f"<div class='row'>{owner_table}"
+        else:
+            owner_tables += f"{owner_table}"
+        if owner_counter % 3 == 2:
+            owner_tables += "</div>"
+        owner_counter += 1
+
+    if owner_counter % 3 != 0:
+        owner_tables += "</div>"
+
+    html_content = HTML_TEMPLATE.format(
+        value_rows=value_rows,
+        low_cost_rows=low_cost_rows,
+        ranking_rows=ranking_rows,
+        owner_tables=owner_tables,
+        timestamp=TIMESTAMP,
+        trends="",
+    )
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write(html_content)
+
+
+def render_streaming(owner_teams, owner_totals, owner_names, output_path):
+    generate_html_output(owner_teams, owner_totals, owner_names, output_path, TIMESTAMP)
+
+
+# Seconds per render and peak traced bytes, both over a page of the same
+# size already on disk, the way a nightly run finds it
+def measure(render, args, output_path, repeats):
+    render(*args, output_path)
+
+    tracemalloc.start()
+    render(*args, output_path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for _ in range(repeats):
+        render(*args, output_path)
+    return (time.perf_counter() - start) / repeats, peak
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [19, 200, 2000, 20000]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        old_path = os.path.join(tmp, "old.html")
+        new_path = os.path.join(tmp, "new.html")
+
+        print(f"{'owners':>8} {'page KB':>8} {'strings ms':>11} {'peak MB':>8} {'stream ms':>10} {'peak MB':>8}")
+        for n_owners in sizes:
+            league, teams_and_wins = synthetic_league(n_owners)
+            owner_teams = league.owner_teams(teams_and_wins)
+            owner_totals = {owner: sum(team[1] for team in teams) for owner, teams in owner_teams.items()}
+            args = (owner_teams, owner_totals, league.owner_names)
+            repeats = 5 if n_owners < 5000 else 1
+
+            # Keep the per-file "saved" messages out of the table
+            stdout, sys.stdout = sys.stdout, open(os.devnull, "w")
+            try:
+                old_time, old_peak = measure(render_with_strings, args, old_path, repeats)
+                new_time, new_peak = measure(render_streaming, args, new_path, repeats)
+            finally:
+                sys.stdout.close()
+                sys.stdout = stdout
+
+            with open(old_path, "rb") as a, open(new_path, "rb") as b:
+                if a.read() != b.read():
+                    print(f"WARNING: renderers disagree for {n_owners} owners!")
+                    sys.exit(1)
+
+            size = os.path.getsize(new_path) / 1024
+            print(f"{n_owners:>8} {size:>8.0f} {old_time * 1000:>11.1f} {old_peak / 2**20:>8.1f} "
+                  f"{new_time * 1000:>10.1f} {new_peak / 2**20:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
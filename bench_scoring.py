@@ -0,0 +1,68 @@
+import sys
+import time
+
+from scoring_matrix import LeagueMatrix
+from synthetic_league import synthetic_league
+
+# Usage: python bench_scoring.py [owners ...]
+# Compares the tuple loops the scripts used with the matrix engine.
+
+
+# What run_fantasy_basketball_game() and generate_html_output() did per run
+def score_with_tuples(league, teams_and_wins):
+    owner_teams = league.owner_teams(teams_and_wins)
+    owner_totals = {owner: sum([team[1] for team in teams]) for owner, teams in owner_teams.items()}
+    ranking = sorted(owner_totals.items(), key=lambda x: x[1], reverse=True)
+
+    team_values = []
+    low_cost_teams = []
+    for owner, teams in owner_teams.items():
+        for team_name, wins, cost in teams:
+            team_values.append((owner, team_name, wins, cost, wins - cost))
+            if cost <= 1:
+                low_cost_teams.append((owner, team_name, wins, cost))
+
+    top_values = sorted(team_values, key=lambda x: x[4], reverse=True)[:5]
+    top_low_cost = sorted(low_cost_teams, key=lambda x: x[2], reverse=True)[:5]
+    return ranking, top_values, top_low_cost
+
+
+def score_with_matrix(matrix, teams_and_wins):
+    wins = matrix.wins_vector(teams_and_wins)
+    return matrix.ranking(wins), matrix.top_values(wins), matrix.top_low_cost(wins)
+
+
+def timed(fn, *args, repeats=5):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        result = fn(*args)
+    return result, (time.perf_counter() - start) / repeats
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [19, 200, 2000, 20000]
+
+    print(f"{'owners':>8} {'tuples ms':>10} {'matrix ms':>10} {'speedup':>8}")
+    for n_owners in sizes:
+        league, teams_and_wins = synthetic_league(n_owners)
+        matrix = LeagueMatrix(league)
+
+        expected, tuple_time = timed(score_with_tuples, league, teams_and_wins)
+        result, matrix_time = timed(score_with_matrix, matrix, teams_and_wins)
+
+        if result != expected:
+            print(f"WARNING: engines disagree for {n_owners} owners!")
+            sys.exit(1)
+
+        print(f"{n_owners:>8} {tuple_time * 1000:>10.2f} {matrix_time * 1000:>10.2f} {tuple_time / matrix_time:>7.1f}x")
+
+    # Many scoring variants in one pass: one wins column per variant
+    league, teams_and_wins = synthetic_league(2000)
+    matrix = LeagueMatrix(league)
+    variants = matrix.wins_vector(teams_and_wins)[:, None].repeat(100, axis=1)
+    _, variant_time = timed(matrix.totals, variants)
+    print(f"100 scoring variants x 2000 owners: {variant_time * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
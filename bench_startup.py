@@ -0,0 +1,100 @@
+import argparse
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from fetcher import season_url
+from league import load_league
+
+# Usage: python bench_startup.py [--runs N] [--max-ms MS]
+# Startup cost of the entry points, from `python -X importtime`, and the
+# wall time of a cached run (fantasy_basketball_game.py --cached) from
+# stored standings to rendered files. Exits with 1 if an entry point takes
+# longer than --max-ms to import, or if the cached run loads a network or
+# parsing library it shouldn't need.
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ENTRY_POINTS = ["league_engine", "fantasy_basketball_game", "pipeline", "daemon", "run_all_leagues"]
+# Only a fetch or an HTML parse should load these
+HEAVY_MODULES = {"requests", "urllib3", "bs4", "numpy"}
+
+
+# {module: cumulative microseconds} from -X importtime's stderr
+def parse_importtime(stderr):
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def import_ms(module, runs):
+    samples = []
+    for _ in range(runs):
+        result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                                cwd=HERE, capture_output=True, text=True, check=True)
+        samples.append(parse_importtime(result.stderr)[module] / 1000)
+    return statistics.median(samples)
+
+
+# A .cache with standings for the 2026 league, as a previous fetch would leave
+def seed_cache(directory):
+    league = load_league("2026")
+    rng = random.Random(0)
+    cache = {season_url(league.season): {
+        "etag": None,
+        "last_modified": None,
+        "teams_and_wins": {school: rng.randint(0, 30) for school in league.schools()},
+    }}
+    os.makedirs(os.path.join(directory, ".cache"))
+    with open(os.path.join(directory, ".cache", "http_cache.json"), "w", encoding="utf-8") as f:
+        json.dump(cache, f)
+
+
+def cached_run(runs):
+    samples = []
+    heavy = set()
+    with tempfile.TemporaryDirectory() as tmp:
+        seed_cache(tmp)
+        for _ in range(runs):
+            start = time.perf_counter()
+            result = subprocess.run([sys.executable, "-X", "importtime",
+                                     os.path.join(HERE, "fantasy_basketball_game.py"), "--cached"],
+                                    cwd=tmp, capture_output=True, text=True, check=True)
+            samples.append((time.perf_counter() - start) * 1000)
+            heavy |= HEAVY_MODULES & set(parse_importtime(result.stderr))
+    return statistics.median(samples), heavy
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure start-up time of the entry points.")
+    parser.add_argument("--runs", type=int, default=5, help="runs per measurement (median is reported)")
+    parser.add_argument("--max-ms", type=float, default=100, help="fail if an import takes longer than this")
+    args = parser.parse_args()
+
+    failed = False
+    print(f"{'entry point':<26} {'import ms':>10}")
+    for module in ENTRY_POINTS:
+        ms = import_ms(module, args.runs)
+        flag = "  SLOW" if ms > args.max_ms else ""
+        failed = failed or bool(flag)
+        print(f"{module:<26} {ms:>10.1f}{flag}")
+
+    ms, heavy = cached_run(args.runs)
+    print(f"{'cached run (wall)':<26} {ms:>10.1f}")
+    if heavy:
+        print(f"Cached run loaded {', '.join(sorted(heavy))}, which it shouldn't need.")
+        failed = True
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
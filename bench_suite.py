@@ -0,0 +1,413 @@
+import argparse
+import gzip
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from email.utils import formatdate, parsedate_to_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from delta_scoring import DeltaScorer
+from fetcher import fetch_standings, season_url
+from http_session import RateLimiter, make_session
+from league import load_league
+from league_engine import render_outputs
+from school_names import SchoolIndex
+from snapshots import list_snapshots, load_snapshot, page_hash
+from standings_store import INT_COLUMNS, teams_and_wins_for_page
+from stats_parser import parse_school_stats
+from synthetic_league import synthetic_league
+
+try:
+    from scoring_matrix import LeagueMatrix
+except ImportError:
+    LeagueMatrix = None
+
+# Usage: python bench_suite.py [--sizes N ...] [--save-baseline] [--record]
+#
+# End-to-end timings of every stage, fully offline:
+#   fixture cases    the 2025 and 2026 leagues against saved stats pages in
+#                    bench_fixtures/, served from a local HTTP server
+#                    (fetch, fetch-304, parse, store, match, score, render)
+#   synthetic cases  made-up leagues of increasing size (score,
+#                    score-matrix when numpy is installed, render, and
+#                    render-again over the outputs of a first render)
+# Each stage reports its median time, peak traced memory and throughput.
+# The results are compared with bench_fixtures/baseline.json, and the run
+# exits with 1 if a stage got slower or hungrier than the tolerances allow.
+# Baselines are machine-specific: re-save one with --save-baseline after
+# moving machines or after a deliberate trade-off.
+#
+# --record replaces the fixture pages with the latest real pages in the
+# snapshots/ archive; --generate-fixtures writes stand-in pages in the
+# site's table layout when no real copy is at hand.
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+FIXTURE_DIR = os.path.join(HERE, "bench_fixtures")
+BASELINE_FILE = os.path.join(FIXTURE_DIR, "baseline.json")
+LEAGUES = ["2025", "2026"]
+SIZES = [100, 1000, 10000]
+TIMESTAMP = "2026-01-01 00:00:00"
+
+TOLERANCE = 0.30
+MEMORY_TOLERANCE = 0.30
+# Differences smaller than these are noise whatever the percentage
+SLACK_MS = 5
+SLACK_MB = 0.5
+
+
+def fixture_path(season):
+    return os.path.join(FIXTURE_DIR, f"{season}-school-stats.html.gz")
+
+
+def load_fixture(season):
+    try:
+        with gzip.open(fixture_path(season), "rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _save_fixture(season, content):
+    os.makedirs(FIXTURE_DIR, exist_ok=True)
+    with gzip.GzipFile(fixture_path(season), "wb", compresslevel=9, mtime=0) as f:
+        f.write(content)
+
+
+# Save the newest archived real page of each season as its fixture
+def record_fixtures(seasons):
+    for season in seasons:
+        entries = [entry for entry in list_snapshots() if entry.get("url") == season_url(season)]
+        if not entries:
+            print(f"No archived page for {season}; fetch it once first.")
+            continue
+        content, entry = load_snapshot(entries[-1]["hash"])
+        _save_fixture(season, content)
+        print(f"Recorded {season} from snapshot {entry['hash'][:12]} fetched {entry['fetched_at']}.")
+
+
+# Stand-in page with the stats table laid out the way the site does it:
+# a two-row <thead>, header rows repeated in the body, "NCAA" after the
+# tournament teams, and a large page around the table
+def generate_fixture(season, schools):
+    rng = random.Random(season)
+    schools = sorted(set(schools) | {f"School {i}" for i in range(365 - len(set(schools)))})
+
+    stats = ["ranker", "school_name", "g", "wins", "losses", "win_loss_pct", "srs", "sos", "x", "wins_conf",
+             "losses_conf", "x", "wins_home", "losses_home", "x", "wins_visitor", "losses_visitor", "x", "pts",
+             "opp_pts", "x", "mp", "fg", "fga", "fg_pct", "fg3", "fg3a", "fg3_pct", "ft", "fta", "ft_pct", "orb",
+             "trb", "ast", "stl", "blk", "tov", "pf"]
+    header = "<tr>" + "".join(f'<th data-stat="{stat}">{stat}</th>' for stat in stats) + "</tr>"
+
+    parts = ["<!DOCTYPE html><html><head><title>School Stats</title>"]
+    parts += [f"<script>var nav{i} = {json.dumps(['x' * 40] * 40)};</script>" for i in range(300)]
+    parts.append("</head><body><div id='nav'>")
+    parts += [f"<a href='/cbb/schools/{i}/'>Link {i}</a>" for i in range(3000)]
+    parts.append("</div><table class='sortable' id=\"basic_school_stats\"><thead>")
+    parts.append('<tr class="over_header"><th></th><th colspan="7">Overall</th></tr>' + header + "</thead><tbody>")
+
+    for i, school in enumerate(schools):
+        if i and i % 20 == 0:
+            parts.append(header.replace("<tr>", '<tr class="thead">'))
+        wins = rng.randint(0, 35)
+        losses = rng.randint(0, 35 - wins) if wins < 35 else 0
+        games = wins + losses
+        name = f"<a href='/cbb/schools/{i}/'>{school}</a>" + ("&nbsp;<small>NCAA</small>" if wins > 24 else "")
+        values = {"ranker": i + 1, "school_name": name, "g": games, "wins": wins, "losses": losses,
+                  "win_loss_pct": f"{wins / games:.3f}" if games else "", "srs": f"{rng.uniform(-20, 20):.2f}",
+                  "sos": f"{rng.uniform(-10, 10):.2f}", "wins_conf": wins // 2, "losses_conf": losses // 2}
+        cells = [f'<th scope="row" data-stat="ranker">{i + 1}</th>']
+        cells += [f'<td data-stat="{stat}">{values.get(stat, rng.randint(0, 999))}</td>' for stat in stats[1:]]
+        parts.append("<tr >" + "".join(cells) + "</tr>")
+
+    parts.append("</tbody></table><div id='footer'>")
+    parts += [f"<p>Footer paragraph {i}</p>" for i in range(2000)]
+    parts.append("</div></body></html>")
+    return "".join(parts).encode("utf-8")
+
+
+def generate_fixtures(seasons):
+    for season in seasons:
+        schools = [school for key in LEAGUES for school in load_league(key).schools()]
+        _save_fixture(season, generate_fixture(season, schools))
+        print(f"Wrote a generated stand-in page for {season}.")
+
+
+# Serves the fixture pages at /<season>-school-stats.html, answering
+# If-Modified-Since with 304 like the site
+class _FixtureHandler(BaseHTTPRequestHandler):
+    pages = {}
+    last_modified = formatdate(0, usegmt=True)
+
+    def do_GET(self):
+        content = self.pages.get(self.path.lstrip("/"))
+        if content is None:
+            self.send_response(404)
+            self.end_headers()
+            return
+
+        since = self.headers.get("If-Modified-Since")
+        if since and parsedate_to_datetime(since) >= parsedate_to_datetime(self.last_modified):
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(content)))
+        self.send_header("Last-Modified", self.last_modified)
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@contextmanager
+def fixture_server(pages):
+    _FixtureHandler.pages = {f"{season}-school-stats.html": content for season, content in pages.items()}
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FixtureHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+# Run inside a fresh working directory, so .cache/, snapshots/ and the
+# outputs start empty
+@contextmanager
+def fresh_dir():
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            yield tmp
+        finally:
+            os.chdir(cwd)
+
+
+@contextmanager
+def _no_dir():
+    yield None
+
+
+@contextmanager
+def quiet():
+    stdout, sys.stdout = sys.stdout, open(os.devnull, "w")
+    try:
+        yield
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+
+
+# Median seconds over repeats, then peak traced bytes from one more run.
+# setup() runs untimed before each call and returns its arguments; with
+# cold=True every call also gets a fresh working directory.
+def measure(fn, setup=lambda: (), repeats=5, cold=False):
+    def once(trace):
+        with (fresh_dir() if cold else _no_dir()):
+            args = setup()
+            if trace:
+                tracemalloc.start()
+            start = time.perf_counter()
+            fn(*args)
+            elapsed = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1] if trace else 0
+            if trace:
+                tracemalloc.stop()
+        return elapsed, peak
+
+    with quiet():
+        times = [once(False)[0] for _ in range(repeats)]
+        peak = once(True)[1]
+    return statistics.median(times), peak
+
+
+def fast_limiter():
+    return RateLimiter(path=os.path.join(tempfile.gettempdir(), "bench_suite_rate.json"),
+                       per_minute=10 ** 9, burst=10 ** 9)
+
+
+def fixture_case(key, content, base_url, repeats):
+    league = load_league(key)
+    url = season_url(league.season, base_url)
+    session = make_session()
+    limiter = fast_limiter()
+    n_schools = len(parse_school_stats(content, INT_COLUMNS).get("school_name", []))
+
+    teams_and_wins = teams_and_wins_for_page(content)
+    index = SchoolIndex(teams_and_wins).build(league.schools())
+    remapped = index.remap(teams_and_wins)
+    n_slots = sum(len(teams) for teams in league.rosters.values())
+
+    def score():
+        scorer = DeltaScorer(league.rosters)
+        scorer.update(remapped)
+        owner_teams = {owner: scorer.owner_teams(owner) for owner in league.rosters}
+        return owner_teams, dict(scorer.ranking())
+
+    owner_teams, owner_totals = score()
+
+    def warm_fetch():
+        fetch_standings(url, session, limiter)
+        return ()
+
+    def warm_store():
+        teams_and_wins_for_page(content)
+        return ()
+
+    stages = [
+        ("fetch", lambda: fetch_standings(url, session, limiter), lambda: (), True, n_schools, "schools"),
+        ("fetch-304", lambda: fetch_standings(url, session, limiter), warm_fetch, True, n_schools, "schools"),
+        ("parse", lambda: parse_school_stats(content, INT_COLUMNS), lambda: (), False, n_schools, "schools"),
+        ("store", lambda: teams_and_wins_for_page(content), warm_store, True, n_schools, "schools"),
+        ("match", lambda: SchoolIndex(teams_and_wins).build(league.schools()), lambda: (), True,
+         len(league.schools()), "schools"),
+        ("score", score, lambda: (), False, n_slots, "slots"),
+        ("render", lambda: render_outputs(league, owner_teams, owner_totals, TIMESTAMP), lambda: (), True,
+         len(league.rosters), "owners"),
+    ]
+    return [(f"{key}/{name}", measure(fn, setup, repeats, cold), count, unit)
+            for name, fn, setup, cold, count, unit in stages]
+
+
+def synthetic_case(n_owners, repeats):
+    league, teams_and_wins = synthetic_league(n_owners)
+    n_slots = sum(len(teams) for teams in league.rosters.values())
+
+    def score():
+        scorer = DeltaScorer(league.rosters)
+        scorer.update(teams_and_wins)
+        owner_teams = {owner: scorer.owner_teams(owner) for owner in league.rosters}
+        return owner_teams, dict(scorer.ranking())
+
+    owner_teams, owner_totals = score()
+    repeats = repeats if n_owners < 5000 else max(1, repeats // 3)
+    rows = [(f"synthetic-{n_owners}/score", measure(score, repeats=repeats), n_slots, "slots")]
+
+    # What run_all_leagues does for big leagues: build the matrix and score
+    if LeagueMatrix is not None:
+        def score_matrix():
+            return LeagueMatrix(league).score(teams_and_wins)
+
+        if score_matrix() != (owner_teams, owner_totals):
+            print(f"WARNING: scoring engines disagree for {n_owners} owners!")
+            sys.exit(1)
+        rows.append((f"synthetic-{n_owners}/score-matrix", measure(score_matrix, repeats=repeats), n_slots, "slots"))
+
+    def render():
+        return render_outputs(league, owner_teams, owner_totals, TIMESTAMP)
+
+    # A later run finds last run's outputs on disk and compares with them
+    def render_first():
+        render()
+        return ()
+
+    return rows + [
+        (f"synthetic-{n_owners}/render", measure(render, repeats=repeats, cold=True), n_owners, "owners"),
+        (f"synthetic-{n_owners}/render-again", measure(render, render_first, repeats, cold=True), n_owners, "owners"),
+    ]
+
+
+def load_baseline(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+# Names of the results that regressed against the baseline
+def regressions(results, baseline, tolerance, memory_tolerance, fixtures):
+    failures = []
+    for name, result in results.items():
+        base = baseline["results"].get(name)
+        case = name.split("/")[0]
+        if base is None or (case in fixtures and baseline["fixtures"].get(case) != fixtures[case]):
+            continue
+        if result["ms"] > base["ms"] * (1 + tolerance) + SLACK_MS:
+            failures.append(f"{name}: {result['ms']:.1f} ms vs {base['ms']:.1f} ms")
+        if result["peak_mb"] > base["peak_mb"] * (1 + memory_tolerance) + SLACK_MB:
+            failures.append(f"{name}: {result['peak_mb']:.1f} MB vs {base['peak_mb']:.1f} MB peak")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline end-to-end benchmarks with a regression check.")
+    parser.add_argument("--sizes", type=int, nargs="*", default=SIZES, help="synthetic league sizes (owners)")
+    parser.add_argument("--repeats", type=int, default=5, help="timed runs per stage (median is reported)")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="baseline file to compare with or save to")
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE,
+                        help="allowed slow-down as a fraction of the baseline time (default 0.30)")
+    parser.add_argument("--memory-tolerance", type=float, default=MEMORY_TOLERANCE,
+                        help="allowed growth of peak memory as a fraction (default 0.30)")
+    parser.add_argument("--record", action="store_true", help="save the latest archived real pages as fixtures")
+    parser.add_argument("--generate-fixtures", action="store_true", help="write generated stand-in fixture pages")
+    args = parser.parse_args()
+    args.baseline = os.path.abspath(args.baseline)
+
+    seasons = sorted({load_league(key).season for key in LEAGUES})
+    if args.record:
+        record_fixtures(seasons)
+    if args.generate_fixtures:
+        generate_fixtures(seasons)
+
+    pages = {season: load_fixture(season) for season in seasons}
+    missing = [str(season) for season, content in pages.items() if content is None]
+    if missing:
+        print(f"No fixture page for {', '.join(missing)}; run with --record or --generate-fixtures.")
+        sys.exit(1)
+
+    # Caches and outputs go to a scratch folder, never this checkout
+    rows = []
+    with fresh_dir(), fixture_server(pages) as base_url:
+        for key in LEAGUES:
+            rows += fixture_case(key, pages[load_league(key).season], base_url, args.repeats)
+        for n_owners in args.sizes:
+            rows += synthetic_case(n_owners, args.repeats)
+
+    results = {}
+    print(f"{'stage':<28} {'ms':>9} {'peak MB':>8} {'throughput':>18}")
+    for name, (seconds, peak), count, unit in rows:
+        results[name] = {"ms": round(seconds * 1000, 3), "peak_mb": round(peak / 2 ** 20, 3)}
+        rate = f"{count / seconds:,.0f} {unit}/s" if seconds else "-"
+        print(f"{name:<28} {seconds * 1000:>9.2f} {peak / 2 ** 20:>8.2f} {rate:>18}")
+
+    fixtures = {key: page_hash(pages[load_league(key).season]) for key in LEAGUES}
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({"fixtures": fixtures, "results": results}, f, indent=1, sort_keys=True)
+        print(f"Baseline saved to '{args.baseline}'.")
+        return
+
+    baseline = load_baseline(args.baseline)
+    if baseline is None:
+        print("No baseline to compare with; save one with --save-baseline.")
+        return
+
+    stale = [key for key in fixtures if baseline["fixtures"].get(key) != fixtures[key]]
+    if stale:
+        print(f"Fixture pages changed since the baseline, not comparing: {', '.join(stale)}")
+
+    failures = regressions(results, baseline, args.tolerance, args.memory_tolerance, fixtures)
+    if failures:
+        print("Regressions against the baseline:")
+        print("\n".join(f"  {failure}" for failure in failures))
+        sys.exit(1)
+    print("No regressions against the baseline.")
+
+
+if __name__ == "__main__":
+    main()
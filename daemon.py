@@ -0,0 +1,185 @@
+import argparse
+import os
+import shutil
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from fetcher import BASE_URL
+from history import TIME_FORMAT
+from league import LeagueError, load_league
+from pipeline import Pipeline
+from snapshots import load_snapshot
+
+# Keeps running and updates the leagues on a schedule instead of starting a
+# fresh process for every update. The league files, school name indexes,
+# scorers and HTTP session stay warm in memory between polls.
+#
+# How often to poll depends on when games are played:
+#   tournament   conference tournaments and March Madness, in the game window
+#   game window  the rest of the season, late morning to past midnight
+#   overnight    in season, outside the game window
+#   off-season   between the title game and November
+# After each poll that changed nothing the interval doubles, up to
+# IDLE_BACKOFF times the base, so a quiet evening polls less. The next poll
+# is never scheduled later than the start of a busier period.
+TOURNAMENT_MINUTES = 5
+GAME_WINDOW_MINUTES = 15
+OVERNIGHT_MINUTES = 120
+OFF_SEASON_MINUTES = 12 * 60
+IDLE_BACKOFF = 4
+
+# (month, day) ranges, inclusive
+SEASON = ((11, 1), (4, 10))
+TOURNAMENT = ((3, 1), (4, 8))
+# Local hours games can be in progress
+GAME_HOURS = set(range(11, 24)) | {0}
+
+
+def _in_range(when, date_range):
+    start, end = date_range
+    day = (when.month, when.day)
+    if start <= end:
+        return start <= day <= end
+    return day >= start or day <= end
+
+
+class Schedule:
+    def __init__(self):
+        # Polls in a row that changed nothing
+        self.idle = 0
+
+    # (period name, base interval in minutes) for a moment in time
+    def period(self, when):
+        if not _in_range(when, SEASON):
+            return "off-season", OFF_SEASON_MINUTES
+        if when.hour not in GAME_HOURS:
+            return "overnight", OVERNIGHT_MINUTES
+        if _in_range(when, TOURNAMENT):
+            return "tournament", TOURNAMENT_MINUTES
+        return "game window", GAME_WINDOW_MINUTES
+
+    # When to poll next, given the time now and whether the last poll
+    # changed anything. Returns (datetime, period name).
+    def next_poll(self, now, changed):
+        self.idle = 0 if changed else self.idle + 1
+        name, minutes = self.period(now)
+        minutes *= min(2 ** self.idle, IDLE_BACKOFF)
+        next_time = now + timedelta(minutes=minutes)
+
+        # Wake up for the first hour of a busier period on the way
+        hour = now.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+        while hour < next_time:
+            if self.period(hour)[1] < self.period(now)[1]:
+                self.idle = 0
+                return hour, self.period(hour)[0]
+            hour += timedelta(hours=1)
+
+        return next_time, name
+
+
+class SystemClock:
+    def now(self):
+        return datetime.now()
+
+    def sleep(self, seconds):
+        time.sleep(seconds)
+
+
+# Stand-in clock for trying out the schedule: sleeping just moves time forward
+class FakeClock:
+    def __init__(self, start):
+        self.current = start
+
+    def now(self):
+        return self.current
+
+    def sleep(self, seconds):
+        self.current += timedelta(seconds=seconds)
+
+
+# Poll the leagues until interrupted, or for max_polls polls
+def run_daemon(league_keys, clock=None, schedule=None, publish=None, replay=None, base_url=BASE_URL,
+               max_polls=None):
+    clock = clock or SystemClock()
+    schedule = schedule or Schedule()
+
+    # Last league that loaded, by key, so a half-saved edit doesn't stop polling
+    leagues = {}
+    polls = 0
+    try:
+        while max_polls is None or polls < max_polls:
+            now = clock.now()
+            changed = False
+            for key in league_keys:
+                # Cached, and reloaded only if the league file was edited
+                try:
+                    leagues[key] = load_league(key)
+                except (LeagueError, OSError) as e:
+                    if key not in leagues:
+                        print(f"Could not load league '{key}', skipping it: {e}")
+                        continue
+                    print(f"Could not reload league '{key}', keeping the last good version: {e}")
+                league = leagues[key]
+                pipeline = Pipeline(league, replay, publish, base_url, now.strftime(TIME_FORMAT))
+                pipeline.run()
+                changed = changed or bool(pipeline.changed)
+            polls += 1
+
+            next_time, period = schedule.next_poll(now, changed)
+            wait = max((next_time - clock.now()).total_seconds(), 0)
+            print(f"Next poll at {next_time:%Y-%m-%d %H:%M} ({period}, in {wait / 60:.0f} min).")
+            if max_polls is None or polls < max_polls:
+                clock.sleep(wait)
+    except KeyboardInterrupt:
+        print("Stopped.")
+
+
+# Try out the schedule on a fake clock starting at `start`. It runs in a
+# scratch folder seeded with a copy of .cache/, so the fake times never
+# reach the real pages or get recorded in the real history.
+def simulate(league_keys, start, replay=None, base_url=BASE_URL, max_polls=None):
+    league_keys = [os.path.abspath(key) if os.path.isfile(key) else key for key in league_keys]
+    cwd = os.getcwd()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if os.path.isdir(".cache"):
+            shutil.copytree(".cache", os.path.join(tmp, ".cache"))
+
+        # A snapshot hash only means something next to the real archive
+        if replay and os.path.isfile(replay):
+            replay = os.path.abspath(replay)
+        elif replay:
+            content, _ = load_snapshot(replay)
+            if content is None:
+                return
+            replay = os.path.join(tmp, "replay.html")
+            with open(replay, "wb") as f:
+                f.write(content)
+
+        print(f"Simulating in a scratch folder; '{cwd}' is left untouched.")
+        os.chdir(tmp)
+        try:
+            run_daemon(league_keys, FakeClock(start), replay=replay, base_url=base_url, max_polls=max_polls)
+        finally:
+            os.chdir(cwd)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Keep the leagues updated on an adaptive schedule.")
+    parser.add_argument("leagues", nargs="+", help="league files or names from leagues/ (e.g. 2026)")
+    parser.add_argument("--base-url", default=BASE_URL,
+                        help="where the <season>-school-stats.html pages live (e.g. a local http.server)")
+    parser.add_argument("--replay", metavar="SNAPSHOT",
+                        help="score from an archived page every poll instead of fetching")
+    parser.add_argument("--simulate", metavar="START",
+                        help="run on a fake clock starting at START (e.g. '2026-03-20 09:00') without waiting, "
+                             "in a scratch folder")
+    parser.add_argument("--polls", type=int, help="stop after this many polls")
+    args = parser.parse_args()
+
+    if args.simulate:
+        simulate(args.leagues, datetime.strptime(args.simulate, "%Y-%m-%d %H:%M"), args.replay, args.base_url,
+                 args.polls)
+    else:
+        run_daemon(args.leagues, replay=args.replay, base_url=args.base_url, max_polls=args.polls)
@@ -0,0 +1,94 @@
+import hashlib
+import json
+import os
+from bisect import bisect_left, insort
+
+# Keeps owner totals and the ranking up to date from one standings update to
+# the next. Only schools whose wins moved are looked at, and only the owners
+# holding them are re-totalled and re-ranked, through a school -> owners index.
+STATE_DIR = ".cache"
+
+
+def roster_hash(rosters):
+    return hashlib.sha256(json.dumps(rosters, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class DeltaScorer:
+    # rosters: {owner: [(team name, standings key, cost), ...]}
+    def __init__(self, rosters):
+        self.rosters = rosters
+        self.owner_order = {owner: i for i, owner in enumerate(rosters)}
+
+        self.school_owners = {}
+        for owner, teams in rosters.items():
+            for _, school, _ in teams:
+                self.school_owners.setdefault(school, []).append(owner)
+
+        self.wins = {}
+        self.totals = {owner: 0 for owner in rosters}
+        self._ranking = sorted(self._rank_key(owner) for owner in rosters)
+
+    # Highest total first, ties kept in roster order like sorted() did
+    def _rank_key(self, owner):
+        return (-self.totals[owner], self.owner_order[owner], owner)
+
+    # Apply new standings. Returns (changed schools, affected owners).
+    def update(self, teams_and_wins):
+        deltas = {}
+        for school in self.school_owners:
+            wins = teams_and_wins.get(school, 0)
+            if wins != self.wins.get(school, 0):
+                deltas[school] = wins - self.wins.get(school, 0)
+                self.wins[school] = wins
+
+        affected = {}
+        for school, delta in deltas.items():
+            for owner in self.school_owners[school]:
+                affected[owner] = affected.get(owner, 0) + delta
+
+        for owner, delta in affected.items():
+            if delta == 0:
+                continue
+            del self._ranking[bisect_left(self._ranking, self._rank_key(owner))]
+            self.totals[owner] += delta
+            insort(self._ranking, self._rank_key(owner))
+
+        return set(deltas), set(affected)
+
+    # [(owner, total), ...] best first
+    def ranking(self):
+        return [(owner, -neg_total) for neg_total, _, owner in self._ranking]
+
+    # Wins of each team on an owner's roster, in roster order
+    def owner_teams(self, owner):
+        return [(team, self.wins.get(school, 0), cost) for team, school, cost in self.rosters[owner]]
+
+    def save(self, path):
+        state = {"rosters": roster_hash(self.rosters), "wins": self.wins, "totals": self.totals}
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, path)
+
+    # Pick up where the last run left off; a roster change starts from scratch
+    @classmethod
+    def load(cls, rosters, path):
+        scorer = cls(rosters)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return scorer
+
+        if state.get("rosters") != roster_hash(rosters):
+            return scorer
+
+        scorer.wins = state["wins"]
+        scorer.totals = state["totals"]
+        scorer._ranking = sorted(scorer._rank_key(owner) for owner in rosters)
+        return scorer
+
+
+def state_path(league):
+    return os.path.join(STATE_DIR, f"delta_{league}.json")
@@ -0,0 +1,74 @@
+import argparse
+
+from http_cache import conditional_headers, load_cache_entry, save_cache_entry
+from http_session import get_session, get_with_retry, make_session
+from snapshots import save_snapshot
+from standings_store import teams_and_wins_for_page
+
+BASE_URL = "https://www.sports-reference.com/cbb/seasons/men"
+
+
+def season_url(season, base_url=BASE_URL):
+    return f"{base_url.rstrip('/')}/{season}-school-stats.html"
+
+
+# Fetch one stats page and return {school name: overall wins}
+def fetch_standings(url, session=None, limiter=None):
+    cache_entry = load_cache_entry(url)
+    response = get_with_retry(url, conditional_headers(cache_entry), session or get_session(), limiter)
+
+    # Nothing changed since the last run, reuse the standings we parsed then
+    if response is not None and response.status_code == 304 and cache_entry:
+        print(f"{url} not modified, using cached results.")
+        return cache_entry["teams_and_wins"]
+
+    if response is None or response.status_code != 200:
+        status = response.status_code if response is not None else "no response"
+        print(f"Failed to retrieve data: {status}")
+        return _last_good_standings(cache_entry)
+
+    save_snapshot(url, response.content)
+
+    teams_and_wins = teams_and_wins_for_page(response.content)
+    if not teams_and_wins:
+        return _last_good_standings(cache_entry)
+
+    save_cache_entry(url, response, teams_and_wins)
+    return teams_and_wins
+
+
+# Better to publish yesterday's standings than a page full of zeros
+def _last_good_standings(cache_entry):
+    if cache_entry and cache_entry.get("teams_and_wins"):
+        print("Falling back to the last good cached standings.")
+        return cache_entry["teams_and_wins"]
+    return {}
+
+
+# Fetch several seasons at once and return {season: teams_and_wins}
+def fetch_seasons(seasons, base_url=BASE_URL, session=None):
+    seasons = list(seasons)
+    if not seasons:
+        return {}
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    session = session or make_session(len(seasons))
+
+    with ThreadPoolExecutor(max_workers=len(seasons)) as pool:
+        futures = {
+            season: pool.submit(fetch_standings, season_url(season, base_url), session)
+            for season in seasons
+        }
+        return {season: future.result() for season, future in futures.items()}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fetch school-stats standings for several seasons at once.")
+    parser.add_argument("seasons", nargs="+", help="season years, e.g. 2025 2026")
+    parser.add_argument("--base-url", default=BASE_URL,
+                        help="where the <season>-school-stats.html pages live (e.g. a local http.server)")
+    args = parser.parse_args()
+
+    for season, teams_and_wins in fetch_seasons(args.seasons, args.base_url).items():
+        print(f"{season}: {len(teams_and_wins)} schools")
@@ -0,0 +1,167 @@
+import json
+import mmap
+import os
+import shutil
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+
+# Append-only history of each run's owner totals and school wins, one folder
+# per league in .cache/history/<league>/:
+#
+#   columns.json  owner ids and schools, in column order
+#   runs.bin      int64 run times (epoch seconds), ascending; this is the index
+#   totals.bin    int32[run][owner]
+#   wins.bin      int16[run][school]
+#
+# Row i of every data file belongs to run i, so finding the runs in a time
+# range is a bisect over runs.bin and reading them is one slice of each
+# mmapped file, however long the season gets. The data files are appended
+# first and runs.bin last: a crash mid-append leaves an unindexed partial
+# row, which the next append cuts off.
+HISTORY_DIR = os.path.join(".cache", "history")
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+# How many runs the trend charts show
+TREND_RUNS = 60
+
+
+def _format_time(when):
+    return datetime.fromtimestamp(when).strftime(TIME_FORMAT)
+
+
+def _read_array(path, typecode, start=0, stop=None):
+    values = array(typecode)
+    try:
+        f = open(path, "rb")
+    except OSError:
+        return values
+
+    with f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return values
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            end = len(data) if stop is None else min(stop * values.itemsize, len(data))
+            values.frombytes(data[start * values.itemsize:end])
+    return values
+
+
+def _append(path, values, keep_bytes):
+    with open(path, "ab") as f:
+        f.truncate(keep_bytes)
+        f.write(values.tobytes())
+        f.flush()
+        os.fsync(f.fileno())
+
+
+class History:
+    def __init__(self, directory, owners, schools):
+        self.directory = directory
+        self.owners = list(owners)
+        self.schools = list(schools)
+
+        columns_path = self._path("columns.json")
+        try:
+            with open(columns_path, "r", encoding="utf-8") as f:
+                columns = json.load(f)
+        except (OSError, ValueError):
+            columns = None
+
+        # A roster change changes the columns; keep the old history aside
+        # and start a new one rather than mixing the two
+        if columns is not None and columns != {"owners": self.owners, "schools": self.schools}:
+            archived = f"{directory}-{datetime.now().strftime('%Y%m%d%H%M%S')}"
+            print(f"Rosters changed, old history moved to '{archived}'.")
+            shutil.move(directory, archived)
+            columns = None
+
+        if columns is None:
+            os.makedirs(directory, exist_ok=True)
+            for name in ("runs.bin", "totals.bin", "wins.bin"):
+                open(self._path(name), "wb").close()
+            tmp_path = columns_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"owners": self.owners, "schools": self.schools}, f)
+            os.replace(tmp_path, columns_path)
+
+    @classmethod
+    def for_league(cls, league):
+        return cls(os.path.join(HISTORY_DIR, league.key), league.rosters, league.schools())
+
+    def _path(self, name):
+        return os.path.join(self.directory, name)
+
+    def __len__(self):
+        return os.path.getsize(self._path("runs.bin")) // 8
+
+    def run_times(self, start=0, stop=None):
+        return _read_array(self._path("runs.bin"), "q", start, stop)
+
+    # Row range [first, last) of the runs between two epoch times
+    def rows_between(self, since=None, until=None):
+        times = self.run_times()
+        first = 0 if since is None else bisect_left(times, since)
+        last = len(times) if until is None else bisect_right(times, until)
+        return first, max(first, last)
+
+    def totals(self, first, last):
+        n = len(self.owners)
+        return _read_array(self._path("totals.bin"), "i", first * n, last * n)
+
+    def wins(self, first, last):
+        n = len(self.schools)
+        return _read_array(self._path("wins.bin"), "h", first * n, last * n)
+
+    # Record a run. Skipped (returns False) if it isn't newer than the last
+    # run or nothing moved since then, so an idle night adds no rows.
+    def append(self, when, totals, wins):
+        rows = len(self)
+        totals = array("i", totals)
+        wins = array("h", wins)
+
+        if rows:
+            last = self.run_times(rows - 1)[0]
+            if when <= last:
+                print(f"History: run at {_format_time(when)} is not after the last recorded run "
+                      f"({_format_time(last)}), not recorded.")
+                return False
+            if totals == self.totals(rows - 1, rows) and wins == self.wins(rows - 1, rows):
+                print("History: nothing changed since the last recorded run, not recorded.")
+                return False
+
+        _append(self._path("totals.bin"), totals, rows * len(self.owners) * totals.itemsize)
+        _append(self._path("wins.bin"), wins, rows * len(self.schools) * wins.itemsize)
+        _append(self._path("runs.bin"), array("q", [when]), rows * 8)
+        return True
+
+    # {owner: (totals, ranks)} over the last `runs` runs, oldest first.
+    # Ranks count from 1, ties in roster order like the page.
+    def trends(self, runs=TREND_RUNS):
+        last = len(self)
+        first = max(0, last - runs)
+        n = len(self.owners)
+        totals = self.totals(first, last)
+
+        ranks = array("h", bytes(len(totals) * 2))
+        for row in range(last - first):
+            offset = row * n
+            order = sorted(range(n), key=lambda j: -totals[offset + j])
+            for rank, j in enumerate(order, 1):
+                ranks[offset + j] = rank
+
+        return {owner: (totals[j::n].tolist(), ranks[j::n].tolist()) for j, owner in enumerate(self.owners)}
+
+
+# Record this run's standings for a league. timestamp is a "Last updated"
+# string; owner_teams is {owner: [(team, wins, cost), ...]} in roster order.
+def record_run(league, timestamp, owner_totals, owner_teams):
+    history = History.for_league(league)
+
+    school_wins = {}
+    for owner, teams in league.rosters.items():
+        for (_, school, _), (_, wins, _) in zip(teams, owner_teams[owner]):
+            school_wins[school] = wins
+
+    when = int(datetime.strptime(timestamp, TIME_FORMAT).timestamp())
+    history.append(when, [owner_totals[owner] for owner in history.owners],
+                   [school_wins.get(school, 0) for school in history.schools])
+    return history
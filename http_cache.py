@@ -0,0 +1,58 @@
+import json
+import os
+import threading
+
+# On-disk cache of the last successful fetch of each stats page
+CACHE_DIR = ".cache"
+CACHE_FILE = os.path.join(CACHE_DIR, "http_cache.json")
+
+# Concurrent fetches share the one cache file
+_cache_lock = threading.Lock()
+
+
+def _load_cache():
+    try:
+        with open(CACHE_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+# Look up what we stored the last time this url returned a 200
+def load_cache_entry(url):
+    return _load_cache().get(url)
+
+
+# Build If-None-Match / If-Modified-Since headers from a cache entry
+def conditional_headers(entry):
+    headers = {}
+    if not entry:
+        return headers
+
+    if entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+
+    return headers
+
+
+# Remember the validators and the parsed result so a 304 can skip parsing.
+# The parsed result is also the fallback when the site can't be reached.
+def save_cache_entry(url, response, teams_and_wins):
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+
+    with _cache_lock:
+        cache = _load_cache()
+        cache[url] = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "teams_and_wins": teams_and_wins,
+        }
+
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_file = CACHE_FILE + ".tmp"
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+        os.replace(tmp_file, CACHE_FILE)
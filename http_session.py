@@ -0,0 +1,153 @@
+import json
+import os
+import threading
+import time
+
+# sports-reference asks for no more than 20 requests a minute. The budget is
+# kept on disk so every script and process on this machine draws from it.
+RATE_LIMIT_FILE = os.path.join(".cache", "rate_limit.json")
+REQUESTS_PER_MINUTE = 20
+BURST = 5
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_RETRIES = 4
+BACKOFF_SECONDS = 2
+MAX_BACKOFF_SECONDS = 120
+TIMEOUT_SECONDS = 30
+
+
+# Token bucket shared between processes through a small JSON file.
+# A lock file created with O_EXCL guards updates, which works on Windows too.
+class RateLimiter:
+    def __init__(self, path=RATE_LIMIT_FILE, per_minute=REQUESTS_PER_MINUTE, burst=BURST):
+        self.path = path
+        self.rate = per_minute / 60.0
+        self.burst = burst
+        self._thread_lock = threading.Lock()
+
+    def _lock(self):
+        lock_path = self.path + ".lock"
+        deadline = time.time() + 10
+        while True:
+            try:
+                return os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                # A crashed process can leave the lock behind
+                if time.time() > deadline:
+                    # Another process may have cleared it first
+                    try:
+                        os.remove(lock_path)
+                    except FileNotFoundError:
+                        pass
+                    deadline = time.time() + 10
+                time.sleep(0.01)
+
+    def _unlock(self, fd):
+        os.close(fd)
+        try:
+            os.remove(self.path + ".lock")
+        except FileNotFoundError:
+            pass
+
+    # Take one token, returning how long the caller has to wait for it
+    def _take(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        fd = self._lock()
+        try:
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    state = json.load(f)
+            except (OSError, ValueError):
+                state = {"tokens": self.burst, "updated": time.time()}
+
+            now = time.time()
+            tokens = min(self.burst, state["tokens"] + (now - state["updated"]) * self.rate)
+            tokens -= 1
+            wait = 0 if tokens >= 0 else -tokens / self.rate
+
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump({"tokens": tokens, "updated": now}, f)
+        finally:
+            self._unlock(fd)
+
+        return wait
+
+    def acquire(self):
+        with self._thread_lock:
+            wait = self._take()
+        if wait > 0:
+            print(f"Rate limit reached, waiting {wait:.1f}s...")
+            time.sleep(wait)
+
+
+_shared_session = None
+_shared_limiter = None
+_session_lock = threading.Lock()
+
+
+# Keep-alive session with a connection pool big enough for concurrent fetches.
+# requests is imported here and in get_with_retry(), the first time a request
+# is made, so runs that never touch the network (replays, cached runs) don't
+# pay for loading it.
+def make_session(pool_size=8):
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session():
+    global _shared_session
+    with _session_lock:
+        if _shared_session is None:
+            _shared_session = make_session()
+        return _shared_session
+
+
+def get_rate_limiter():
+    global _shared_limiter
+    with _session_lock:
+        if _shared_limiter is None:
+            _shared_limiter = RateLimiter()
+        return _shared_limiter
+
+
+def _retry_delay(response, attempt):
+    retry_after = response.headers.get("Retry-After") if response is not None else None
+    if retry_after and retry_after.isdigit():
+        return min(int(retry_after), MAX_BACKOFF_SECONDS)
+    return min(BACKOFF_SECONDS * 2 ** attempt, MAX_BACKOFF_SECONDS)
+
+
+# GET through the shared session and rate limiter, backing off on 429/5xx
+# and connection errors. Returns the last response, or None if every attempt
+# failed to connect.
+def get_with_retry(url, headers=None, session=None, limiter=None, max_retries=MAX_RETRIES):
+    import requests
+
+    session = session or get_session()
+    limiter = limiter or get_rate_limiter()
+
+    response = None
+    for attempt in range(max_retries + 1):
+        limiter.acquire()
+        try:
+            response = session.get(url, headers=headers, timeout=TIMEOUT_SECONDS)
+        except requests.RequestException as e:
+            print(f"Request to {url} failed: {e}")
+            response = None
+        else:
+            if response.status_code not in RETRY_STATUSES:
+                return response
+
+        if attempt < max_retries:
+            delay = _retry_delay(response, attempt)
+            status = response.status_code if response is not None else "no response"
+            print(f"Retrying {url} in {delay}s ({status}, attempt {attempt + 1}/{max_retries})...")
+            time.sleep(delay)
+
+    return response
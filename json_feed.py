@@ -0,0 +1,77 @@
+import json
+
+from atomic_file import AtomicFile
+
+# standings.json, the data behind standings.html:
+#
+#   {"updated": "2026-01-01 09:00:00",
+#    "owners": [
+#     {"name": "Dollar General", "total": 101, "teams": [["Arizona", 20, 20], ...]},
+#     ...],
+#    "value_leaders": [["Dollar General", "Arizona", 20, 20, 0], ...],
+#    "low_cost_leaders": [["E-3", "Temple", 12, 0.5], ...]}
+#
+# Owners are in ranking order, one per line, so a night where a few owners
+# change is a diff of a few lines.
+
+
+# The feed for a render_model.RenderModel
+def build_feed(model):
+    return {
+        "updated": model.timestamp,
+        "owners": [
+            {
+                "name": owner.name,
+                "total": owner.total,
+                "teams": [list(team) for team in owner.teams],
+            }
+            for owner in model.owners
+        ],
+        "value_leaders": [list(row) for row in model.value_leaders],
+        "low_cost_leaders": [list(row) for row in model.low_cost_leaders],
+    }
+
+
+def _dumps(value):
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def feed_text(feed):
+    lines = ["{" + f'"updated":{_dumps(feed["updated"])},']
+    lines.append('"owners":[')
+    owners = feed["owners"]
+    for i, owner in enumerate(owners):
+        lines.append(_dumps(owner) + ("," if i < len(owners) - 1 else ""))
+    lines.append("],")
+    lines.append(f'"value_leaders":{_dumps(feed["value_leaders"])},')
+    lines.append(f'"low_cost_leaders":{_dumps(feed["low_cost_leaders"])}' + "}")
+    return "\n".join(lines) + "\n"
+
+
+def _without_timestamp(feed):
+    return {key: value for key, value in feed.items() if key != "updated"}
+
+
+# Write the feed unless only its timestamp would change. Returns True if written.
+def write_feed(path, feed):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            current = json.load(f)
+    except (OSError, ValueError):
+        current = None
+
+    # Round-trip so tuples vs lists and int vs float compare like the file
+    if current is not None and _without_timestamp(current) == _without_timestamp(json.loads(feed_text(feed))):
+        print(f"Standings unchanged, '{path}' left as it was.")
+        return False
+
+    with AtomicFile(path) as f:
+        f.write(feed_text(feed))
+
+    print(f"Data feed has been saved to '{path}'.")
+    return True
+
+
+# Writer for output_writers; the feed is already compact, so minify changes nothing
+def write_json(model, path, minify=False):
+    return write_feed(path, build_feed(model))
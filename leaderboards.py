@@ -0,0 +1,65 @@
+import heapq
+from operator import itemgetter
+
+# Top-K tables over every rostered team ("Top 5 by Value", "Most Wins with
+# Cost <= 1", ...). Each board is a key to rank by plus an optional filter,
+# and is answered with a bounded heap, O(n log k), instead of sorting every
+# team. heapq.nlargest keeps ties in input order, the same as
+# sorted(..., reverse=True)[:k] did.
+#
+# For very large leagues scoring_matrix.LeagueMatrix.top_slots does the same
+# selection with numpy's partition.
+
+# Rows are plain (owner, team, wins, cost, value) tuples; building a
+# namedtuple per rostered team costs more than the selection itself
+OWNER, TEAM, WINS, COST, VALUE = range(5)
+
+
+# Every rostered team, in roster order
+def team_rows(owner_teams):
+    return [
+        (owner, team_name, wins, cost, wins - cost)
+        for owner, teams in owner_teams.items()
+        for team_name, wins, cost in teams
+    ]
+
+
+# Keys
+by_value = itemgetter(VALUE)
+by_wins = itemgetter(WINS)
+
+
+# Free teams are treated as costing the cheapest price, 0.25
+def by_wins_per_cost(row):
+    return row[WINS] / max(row[COST], 0.25)
+
+
+# Filters
+def cost_at_most(max_cost):
+    return lambda row: row[COST] <= max_cost
+
+
+# conferences maps team name -> conference
+def in_conference(conferences, conference):
+    return lambda row: conferences.get(row[TEAM]) == conference
+
+
+def top_k(rows, k, key, where=None):
+    if where is not None:
+        rows = (row for row in rows if where(row))
+    return heapq.nlargest(k, rows, key=key)
+
+
+class Leaderboard:
+    def __init__(self, title, key, where=None, k=5):
+        self.title = title
+        self.key = key
+        self.where = where
+        self.k = k
+
+    def rows(self, rows):
+        return top_k(rows, self.k, self.key, self.where)
+
+
+VALUE_LEADERS = Leaderboard("Top 5 Teams by Value (Wins - Cost)", by_value)
+LOW_COST_LEADERS = Leaderboard("Most Wins with Cost ≤ 1", by_wins, cost_at_most(1))
@@ -0,0 +1,180 @@
+import json
+import os
+
+# A league file is JSON shaped like leagues/2026.json:
+#
+#   {
+#       "name": "2026 League",
+#       "season": 2026,
+#       "output": "index.html",
+#       "feed": "standings.json",
+#       "csv": "standings.csv",
+#       "markdown": "standings.md",
+#       "history": true,
+#       "owners": [
+#           {"id": "Owner 1", "name": "Dollar General", "teams": [
+#               {"team": "Arizona", "cost": 20},
+#               {"team": "Tennessee Martin", "school": "Tennessee-Martin", "cost": 5.5},
+#               ...
+#
+# "school" is the name on the stats page and is only needed when it differs
+# from the team name we display. "feed" is optional and names the JSON data
+# file that standings.html renders; "csv" and "markdown" are optional too and
+# name copies of the standings in those formats. "minify" (off by default)
+# strips the whitespace from the page and "precompress" (off by default)
+# writes .gz/.br copies of every output, for a server that sends them with
+# Content-Encoding; GitHub Pages doesn't, and both make every update's
+# commit bigger. "history" records every run in .cache/history/ and charts
+# each owner's trend.
+LEAGUE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "leagues")
+
+
+class LeagueError(ValueError):
+    pass
+
+
+# A league compiled once into lookup-friendly structures
+class League:
+    def __init__(self, key, name, season, output, owner_names, rosters, feed=None, minify=False,
+                 precompress=False, csv=None, markdown=None, history=False):
+        self.key = key
+        self.name = name
+        self.season = season
+        self.output = output
+        self.feed = feed
+        self.csv = csv
+        self.markdown = markdown
+        self.minify = minify
+        self.precompress = precompress
+        self.history = history
+        # {owner id: display name}
+        self.owner_names = owner_names
+        # {owner id: [(team name, stats-page school, cost), ...]}
+        self.rosters = rosters
+
+        # {school: [(owner id, roster slot), ...]}
+        self.school_index = {}
+        for owner, teams in rosters.items():
+            for slot, (_, school, _) in enumerate(teams):
+                self.school_index.setdefault(school, []).append((owner, slot))
+
+    def schools(self):
+        return list(self.school_index)
+
+    # [(format, path), ...] for every file this league writes
+    def outputs(self):
+        formats = [("html", self.output), ("json", self.feed), ("csv", self.csv), ("markdown", self.markdown)]
+        return [(fmt, path) for fmt, path in formats if path]
+
+    # Same shape the scripts always built: {owner: [(team, wins, cost), ...]}
+    def owner_teams(self, teams_and_wins):
+        return {
+            owner: [(team, teams_and_wins.get(school, 0), cost) for team, school, cost in teams]
+            for owner, teams in self.rosters.items()
+        }
+
+
+def _require(condition, where, message):
+    if not condition:
+        raise LeagueError(f"{where}: {message}")
+
+
+# Validate the raw JSON and build a League from it
+def compile_league(data, key, where="league"):
+    _require(isinstance(data, dict), where, "expected a JSON object")
+
+    name = data.get("name", key)
+    season = data.get("season")
+    output = data.get("output", "index.html")
+    feed = data.get("feed")
+    csv = data.get("csv")
+    markdown = data.get("markdown")
+    minify = data.get("minify", False)
+    precompress = data.get("precompress", False)
+    history = data.get("history", False)
+    owners = data.get("owners")
+
+    _require(isinstance(season, int), where, "'season' must be a year like 2026")
+    _require(isinstance(output, str) and output, where, "'output' must be a file name")
+    for field, value in (("feed", feed), ("csv", csv), ("markdown", markdown)):
+        _require(value is None or (isinstance(value, str) and value), where, f"'{field}' must be a file name")
+    _require(isinstance(minify, bool), where, "'minify' must be true or false")
+    _require(isinstance(precompress, bool), where, "'precompress' must be true or false")
+    _require(isinstance(history, bool), where, "'history' must be true or false")
+    _require(isinstance(owners, list) and owners, where, "'owners' must be a non-empty list")
+
+    owner_names = {}
+    rosters = {}
+    for i, owner in enumerate(owners):
+        owner_where = f"{where}: owner #{i + 1}"
+        _require(isinstance(owner, dict), owner_where, "expected an object")
+
+        owner_id = owner.get("id")
+        _require(isinstance(owner_id, str) and owner_id, owner_where, "missing 'id'")
+        _require(owner_id not in rosters, owner_where, f"duplicate id '{owner_id}'")
+
+        teams = owner.get("teams")
+        _require(isinstance(teams, list) and teams, owner_where, "'teams' must be a non-empty list")
+
+        roster = []
+        seen = set()
+        for team in teams:
+            _require(isinstance(team, dict) and isinstance(team.get("team"), str), owner_where,
+                     f"bad team entry {team!r}")
+            team_name = team["team"]
+            school = team.get("school", team_name)
+            cost = team.get("cost")
+
+            _require(isinstance(school, str) and school, owner_where, f"bad school for '{team_name}'")
+            _require(isinstance(cost, (int, float)) and not isinstance(cost, bool) and cost >= 0,
+                     owner_where, f"'{team_name}' needs a cost of 0 or more")
+            _require(school not in seen, owner_where, f"'{school}' is on this roster twice")
+            seen.add(school)
+
+            roster.append((team_name, school, cost))
+
+        owner_names[owner_id] = owner.get("name", owner_id)
+        rosters[owner_id] = roster
+
+    return League(key, name, season, output, owner_names, rosters, feed, minify, precompress, csv, markdown,
+                  history)
+
+
+_loaded = {}
+
+
+# Load a league by path or by key (e.g. "2026" -> leagues/2026.json).
+# Compiled leagues are kept until the file changes.
+def load_league(path_or_key):
+    path = path_or_key
+    if not os.path.isfile(path):
+        path = os.path.join(LEAGUE_DIR, f"{path_or_key}.json")
+
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        raise LeagueError(f"No league file found for '{path_or_key}'")
+
+    cached = _loaded.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    with open(path, "r", encoding="utf-8") as f:
+        try:
+            data = json.load(f)
+        except ValueError as e:
+            raise LeagueError(f"{path}: not valid JSON ({e})")
+
+    key = os.path.splitext(os.path.basename(path))[0]
+    league = compile_league(data, key, where=path)
+    _loaded[path] = (mtime, league)
+    return league
+
+
+# Keys of every league file in the leagues/ folder
+def list_leagues():
+    return sorted(
+        os.path.splitext(name)[0]
+        for name in os.listdir(LEAGUE_DIR)
+        if name.endswith(".json")
+    )
@@ -0,0 +1,154 @@
+import argparse
+import os
+
+from delta_scoring import DeltaScorer, state_path
+from fetcher import BASE_URL, fetch_standings, season_url
+from history import record_run
+from http_cache import load_cache_entry
+from league import load_league
+from output_writers import write_outputs
+from precompress import precompressed_paths, refresh_precompressed
+from render_model import build_model, timestamp_now
+from school_names import SchoolIndex
+from snapshots import load_snapshot
+from standings_store import teams_and_wins_for_page
+
+
+# Standings for a league's season, from the site, from an archived page or,
+# with cached=True, from the last successful fetch without going online.
+# Returns (teams_and_wins, timestamp to show on the page or None for now).
+def league_standings(league, replay=None, base_url=BASE_URL, cached=False):
+    if cached:
+        entry = load_cache_entry(season_url(league.season, base_url))
+        if not entry or not entry.get("teams_and_wins"):
+            print(f"No cached standings for the {league.season} season yet.")
+            return {}, None
+        return entry["teams_and_wins"], None
+
+    if not replay:
+        return fetch_standings(season_url(league.season, base_url)), None
+
+    content, snapshot = load_snapshot(replay)
+    if content is None:
+        return {}, None
+
+    if snapshot["fetched_at"]:
+        print(f"Replaying snapshot {snapshot['hash'][:12]} fetched {snapshot['fetched_at']}")
+    else:
+        # A page from outside the archive, e.g. a benchmark fixture
+        print(f"Replaying snapshot {snapshot['hash'][:12]}, fetch time unknown, stamping with now")
+    return teams_and_wins_for_page(content), snapshot["fetched_at"]
+
+
+# School indexes and scorers kept between runs in a long-lived process
+# (daemon.py), by league key. They are rebuilt when the league file or the
+# set of schools on the stats page changes.
+_indexes = {}
+_scorers = {}
+
+# Below this many owners DeltaScorer is as fast as the matrix engine
+MATRIX_MIN_OWNERS = 1000
+
+
+# Re-key the standings by the school names the league's rosters use, so a
+# naming difference doesn't quietly score 0
+def match_schools(league, teams_and_wins):
+    cached = _indexes.get(league.key)
+    if cached and cached[0] is league and cached[1].page_names == teams_and_wins.keys():
+        return cached[1].remap(teams_and_wins)
+
+    index = SchoolIndex(teams_and_wins).build(league.schools())
+    _indexes[league.key] = (league, index)
+
+    report = index.report()
+    if report:
+        print(f"{league.name}: school name matching")
+        print("\n".join(report))
+
+    return index.remap(teams_and_wins)
+
+
+# Returns owner_teams ({owner: [(team, wins, cost), ...]}) and owner_totals
+def score_league(league, teams_and_wins):
+    # Only schools whose wins moved since the last run touch the totals
+    cached = _scorers.get(league.key)
+    if cached and cached[0] is league:
+        scorer = cached[1]
+    else:
+        scorer = DeltaScorer.load(league.rosters, state_path(league.key))
+        _scorers[league.key] = (league, scorer)
+
+    changed, affected = scorer.update(teams_and_wins)
+    scorer.save(state_path(league.key))
+    print(f"{league.name}: {len(changed)} schools changed, {len(affected)} owners updated.")
+
+    owner_teams = {owner: scorer.owner_teams(owner) for owner in league.rosters}
+    owner_totals = dict(scorer.ranking())
+    return owner_teams, owner_totals
+
+
+# The same as score_league, through scoring_matrix's columnar engine: no
+# saved state, but faster for one-off runs of leagues with
+# MATRIX_MIN_OWNERS or more owners (see bench_suite.py). Returns None when
+# numpy isn't installed.
+def score_league_matrix(league, teams_and_wins):
+    try:
+        from scoring_matrix import LeagueMatrix
+    except ImportError:
+        return None
+
+    owner_teams, owner_totals = LeagueMatrix(league).score(teams_and_wins)
+    print(f"{league.name}: scored {len(owner_totals)} owners.")
+    return owner_teams, owner_totals
+
+
+# Write the league's page and every other output it lists (JSON feed, CSV,
+# Markdown), all from one render model. Returns {path: True if rewritten},
+# compressed copies included.
+def render_outputs(league, owner_teams, owner_totals, timestamp=None):
+    timestamp = timestamp or timestamp_now()
+
+    trends = None
+    if league.history:
+        trends = record_run(league, timestamp, owner_totals, owner_teams).trends()
+
+    model = build_model(owner_teams, owner_totals, league.owner_names, timestamp, trends)
+    written = write_outputs(model, league.outputs(), minify=league.minify)
+
+    if league.precompress:
+        for path, changed in list(written.items()):
+            if os.path.exists(path):
+                rewrote = refresh_precompressed(path, changed)
+                for sibling in precompressed_paths(path):
+                    written[sibling] = rewrote
+
+    return written
+
+
+# Returns True if any of the league's outputs was rewritten
+def render_league(league, owner_teams, owner_totals, timestamp=None):
+    return any(render_outputs(league, owner_teams, owner_totals, timestamp).values())
+
+
+# Returns True if the league's outputs were rewritten
+def run_league(league, replay=None, cached=False):
+    teams_and_wins, timestamp = league_standings(league, replay, cached=cached)
+
+    if not teams_and_wins:
+        print("No standings available, leaving the existing page untouched.")
+        return False
+
+    owner_teams, owner_totals = score_league(league, match_schools(league, teams_and_wins))
+    return render_league(league, owner_teams, owner_totals, timestamp)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Score a fantasy basketball league.")
+    parser.add_argument("league", help="league file, or a name from the leagues/ folder (e.g. 2026)")
+    parser.add_argument("--replay", metavar="SNAPSHOT",
+                        help="score from an archived page (hash, hash prefix or file) instead of fetching")
+    parser.add_argument("--cached", action="store_true",
+                        help="re-render from the last fetched standings without going online")
+    args = parser.parse_args()
+
+    run_league(load_league(args.league), replay=args.replay, cached=args.cached)
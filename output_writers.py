@@ -0,0 +1,101 @@
+import csv
+import io
+import re
+
+from atomic_file import AtomicFile
+from json_feed import write_json
+from leaderboards import LOW_COST_LEADERS, VALUE_LEADERS
+from render import write_html
+
+# Output formats for a render_model.RenderModel. Every writer is called as
+# writer(model, path, minify=False) and returns True if it rewrote the file;
+# a league lists the formats it wants (League.outputs()) and they are all
+# written from the same model in one run.
+
+CSV_HEADER = ["rank", "owner", "owner_total", "team", "wins", "cost", "value"]
+MARKDOWN_TIMESTAMP = re.compile(r"^(Last updated: ).*$", re.M)
+
+
+# Write text unless it matches the file already there, ignoring whatever
+# the volatile pattern matches (e.g. a timestamp) and "\r\n" vs "\n" line
+# endings (a Windows checkout). Returns True if written.
+def write_text(path, text, volatile=None):
+    try:
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            current = f.read().replace("\r\n", "\n")
+    except OSError:
+        current = None
+
+    if current is not None:
+        if volatile is not None:
+            same = volatile.sub(r"\1", current) == volatile.sub(r"\1", text)
+        else:
+            same = current == text
+        if same:
+            print(f"Standings unchanged, '{path}' left as it was.")
+            return False
+
+    with AtomicFile(path) as f:
+        f.write(text)
+
+    print(f"Results have been saved to '{path}'.")
+    return True
+
+
+# One row per rostered team, owners in ranking order. No timestamp, so the
+# file only changes when the standings do.
+def write_csv(model, path, minify=False):
+    out = io.StringIO()
+    writer = csv.writer(out, lineterminator="\n")
+    writer.writerow(CSV_HEADER)
+    for rank, owner in enumerate(model.owners, 1):
+        for team_name, wins, cost in owner.teams:
+            writer.writerow([rank, owner.name, owner.total, team_name, wins, cost, wins - cost])
+    return write_text(path, out.getvalue())
+
+
+def _cell(value):
+    return str(value).replace("|", "\\|")
+
+
+def _markdown_table(header, rows):
+    lines = ["| " + " | ".join(header) + " |", "|" + "---|" * len(header)]
+    for row in rows:
+        lines.append("| " + " | ".join(_cell(value) for value in row) + " |")
+    return lines
+
+
+# The page's tables as GitHub-flavoured Markdown
+def write_markdown(model, path, minify=False):
+    lines = ["# Fantasy Basketball Results", "", f"Last updated: {model.timestamp}", "", "## Rankings", ""]
+    lines += _markdown_table(["Owner", "Total Points"], ((owner.name, owner.total) for owner in model.owners))
+
+    lines += ["", f"## {VALUE_LEADERS.title}", ""]
+    lines += _markdown_table(["Owner", "Team", "Wins", "Cost", "Value"],
+                             ((name, team, wins, f"{cost:.2f}", f"{value:.2f}")
+                              for name, team, wins, cost, value in model.value_leaders))
+
+    lines += ["", f"## {LOW_COST_LEADERS.title}", ""]
+    lines += _markdown_table(["Owner", "Team", "Wins", "Cost"],
+                             ((name, team, wins, f"{cost:.2f}") for name, team, wins, cost in model.low_cost_leaders))
+
+    for owner in model.owners:
+        place = f" ({owner.place})" if owner.place else ""
+        lines += ["", f"### {_cell(owner.name)}{place}", ""]
+        lines += _markdown_table(["Teams", "Points", "Cost"], owner.teams + [("**Total**", owner.total, "-")])
+
+    return write_text(path, "\n".join(lines) + "\n", MARKDOWN_TIMESTAMP)
+
+
+WRITERS = {
+    "html": write_html,
+    "json": write_json,
+    "csv": write_csv,
+    "markdown": write_markdown,
+}
+
+
+# Write every (format, path) in outputs from one model.
+# Returns {path: True if rewritten}.
+def write_outputs(model, outputs, minify=False):
+    return {path: WRITERS[fmt](model, path, minify=minify) for fmt, path in outputs}
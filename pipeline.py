@@ -0,0 +1,98 @@
+import time
+
+from fetcher import BASE_URL
+from league_engine import league_standings, match_schools, render_outputs, score_league
+
+# One update of a league as a chain of stages run back to back in this
+# process: fetch -> score -> render -> publish. Each stage starts as soon as
+# the one before it finishes, and publish only runs when render actually
+# rewrote something.
+STAGES = ("fetch", "score", "render", "publish")
+
+
+class _Stop(Exception):
+    pass
+
+
+class Pipeline:
+    # publish(changed_paths) pushes the rewritten files somewhere; with no
+    # publish the run stops after render. timestamp, if given, is the time
+    # shown on the page instead of now (or the replayed page's fetch time).
+    def __init__(self, league, replay=None, publish=None, base_url=BASE_URL, timestamp=None):
+        self.league = league
+        self.replay = replay
+        self.publish = publish
+        self.base_url = base_url
+        self.timestamp = timestamp
+
+        # {stage: "pending" | "running" | "done" | "skipped" | "failed"}
+        self.status = {stage: "pending" for stage in STAGES}
+        self.seconds = {}
+        self.notes = {}
+        # Paths rewritten by the render stage
+        self.changed = []
+
+    def _set(self, stage, status, note=None):
+        self.status[stage] = status
+        if note:
+            self.notes[stage] = note
+
+    # Mark every stage that hasn't run as skipped and end the run
+    def _stop(self, stage, status, note):
+        self._set(stage, status, note)
+        for later in STAGES[STAGES.index(stage) + 1:]:
+            self._set(later, "skipped", f"{stage} {status}")
+        raise _Stop()
+
+    def _run_stage(self, stage, func, *args):
+        self._set(stage, "running")
+        start = time.perf_counter()
+        try:
+            result = func(*args)
+        except Exception as e:
+            self.seconds[stage] = time.perf_counter() - start
+            self._stop(stage, "failed", f"{type(e).__name__}: {e}")
+        self.seconds[stage] = time.perf_counter() - start
+        self._set(stage, "done")
+        return result
+
+    def _score(self, teams_and_wins):
+        return score_league(self.league, match_schools(self.league, teams_and_wins))
+
+    # Returns True if the update was published
+    def run(self):
+        try:
+            teams_and_wins, timestamp = self._run_stage("fetch", league_standings, self.league, self.replay,
+                                                        self.base_url)
+            if not teams_and_wins:
+                self._stop("fetch", "failed", "no standings available")
+
+            owner_teams, owner_totals = self._run_stage("score", self._score, teams_and_wins)
+
+            written = self._run_stage("render", render_outputs, self.league, owner_teams, owner_totals,
+                                      self.timestamp or timestamp)
+            self.changed = [path for path, changed in written.items() if changed]
+            if not self.changed:
+                self._set("publish", "skipped", "outputs unchanged")
+                return False
+            if self.publish is None:
+                self._set("publish", "skipped", "no publisher")
+                return False
+
+            self._run_stage("publish", self.publish, self.changed)
+            return True
+        except _Stop:
+            return False
+        finally:
+            print(self.summary())
+
+    def summary(self):
+        parts = []
+        for stage in STAGES:
+            part = f"{stage} {self.status[stage]}"
+            if stage in self.seconds:
+                part += f" {self.seconds[stage]:.2f}s"
+            if stage in self.notes:
+                part += f" ({self.notes[stage]})"
+            parts.append(part)
+        return f"{self.league.name}: " + ", ".join(parts)
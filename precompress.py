@@ -0,0 +1,39 @@
+import gzip
+import os
+
+from atomic_file import AtomicFile
+
+# brotli is optional: without it only the .gz siblings are written
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+# Write path.gz (and path.br when brotli is installed) next to a generated file.
+# The gzip header carries no timestamp, so unchanged content gives an
+# identical .gz and no git churn.
+def precompress(path):
+    with open(path, "rb") as f:
+        data = f.read()
+
+    with AtomicFile(path + ".gz", "wb") as f:
+        f.write(gzip.compress(data, compresslevel=9, mtime=0))
+
+    if brotli is not None:
+        with AtomicFile(path + ".br", "wb") as f:
+            f.write(brotli.compress(data, quality=11))
+
+
+# The compressed copies precompress() writes for path
+def precompressed_paths(path):
+    return [path + ".gz"] + ([path + ".br"] if brotli is not None else [])
+
+
+# Compress a file if it was just rewritten or its siblings are missing.
+# Returns True if the siblings were rewritten.
+def refresh_precompressed(path, changed):
+    if changed or not all(os.path.exists(sibling) for sibling in precompressed_paths(path)):
+        precompress(path)
+        return True
+    return False
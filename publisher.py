@@ -0,0 +1,151 @@
+import os
+import subprocess
+import threading
+import time
+
+# Publishes rendered files by committing them to the site's git repo and
+# pushing in the background.
+#
+# Only the files handed to publish() are staged and committed, and only if
+# git sees a difference, so an unchanged night adds no commit. Pushes go to
+# a single worker thread: a push that fails is retried with backoff, and
+# any number of commits made while a push is running or waiting are carried
+# by the next one.
+COMMIT_MESSAGE = "Automated commit after running fantasy basketball game script"
+PUSH_RETRIES = 4
+PUSH_BACKOFF_SECONDS = 5
+MAX_PUSH_BACKOFF_SECONDS = 300
+
+
+class PushQueue:
+    # push() does one push and returns True if it worked
+    def __init__(self, push, retries=PUSH_RETRIES, backoff=PUSH_BACKOFF_SECONDS, sleep=time.sleep):
+        self.push = push
+        self.retries = retries
+        self.backoff = backoff
+        self.sleep = sleep
+
+        self.requested = 0
+        self.pushed = 0
+        self.failed = 0
+
+        self._cond = threading.Condition()
+        self._pending = False
+        self._busy = False
+        self._closing = False
+        self._thread = threading.Thread(target=self._worker, name="git-push", daemon=True)
+        self._thread.start()
+
+    # Ask for a push; returns at once
+    def request(self):
+        with self._cond:
+            self.requested += 1
+            self._pending = True
+            self._cond.notify_all()
+
+    def _worker(self):
+        while True:
+            with self._cond:
+                while not self._pending and not self._closing:
+                    self._cond.wait()
+                if not self._pending:
+                    return
+                # Everything committed up to now goes out with this push
+                self._pending = False
+                self._busy = True
+
+            try:
+                self._push_with_retry()
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
+
+    def _push_with_retry(self):
+        for attempt in range(self.retries + 1):
+            try:
+                ok = self.push()
+            except Exception as e:
+                print(f"Push failed: {e}")
+                ok = False
+
+            if ok:
+                self.pushed += 1
+                return True
+
+            if attempt < self.retries:
+                delay = min(self.backoff * 2 ** attempt, MAX_PUSH_BACKOFF_SECONDS)
+                print(f"Push failed, retrying in {delay}s (attempt {attempt + 1} of {self.retries})...")
+                self.sleep(delay)
+
+        # The commits stay local and go out with the next push
+        self.failed += 1
+        print("Giving up on this push; the next update will push again.")
+        return False
+
+    # Block until nothing is queued or being pushed
+    def wait(self, timeout=None):
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._pending and not self._busy, timeout)
+
+    # Finish any queued push, then stop the worker
+    def close(self, timeout=None):
+        with self._cond:
+            self._closing = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+
+
+class GitPublisher:
+    # push_command defaults to "<git> push"; background=False pushes before
+    # publish() returns
+    def __init__(self, repo_dir=".", git="git", push_command=None, message=COMMIT_MESSAGE, background=True,
+                 **queue_options):
+        self.repo_dir = repo_dir
+        self.git = git
+        self.push_command = push_command or [git, "push"]
+        self.message = message
+        self.queue = PushQueue(self.push, **queue_options) if background else None
+
+    def _run(self, args):
+        return subprocess.run(args, cwd=self.repo_dir, capture_output=True, text=True)
+
+    # Commit the given files if any of them changed and queue a push.
+    # Returns True if a commit was made.
+    def publish(self, paths):
+        paths = [os.path.abspath(path) for path in paths if os.path.exists(path)]
+        if not paths:
+            return False
+
+        added = self._run([self.git, "add", "--"] + paths)
+        if added.returncode != 0:
+            raise RuntimeError(f"git add failed: {added.stderr.strip()}")
+
+        # Exit code 0 means nothing staged for these files differs from HEAD
+        if self._run([self.git, "diff", "--cached", "--quiet", "--"] + paths).returncode == 0:
+            print("Published files unchanged in git, nothing to commit.")
+            return False
+
+        # Commit just these files, whatever else happens to be staged
+        committed = self._run([self.git, "commit", "-m", self.message, "--"] + paths)
+        if committed.returncode != 0:
+            raise RuntimeError(f"git commit failed: {committed.stderr.strip() or committed.stdout.strip()}")
+        print(f"Committed {len(paths)} file(s).")
+
+        if self.queue:
+            self.queue.request()
+        elif not self.push():
+            raise RuntimeError("git push failed")
+        return True
+
+    def push(self):
+        print("Pushing to GitHub...")
+        result = self._run(self.push_command)
+        if result.returncode != 0:
+            print(f"git push failed: {result.stderr.strip()}")
+        return result.returncode == 0
+
+    # Wait for queued pushes to go out and stop the worker
+    def close(self, timeout=None):
+        if self.queue:
+            self.queue.close(timeout)
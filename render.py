@@ -0,0 +1,335 @@
+import hashlib
+import re
+import string
+
+from atomic_file import AtomicFile
+from render_model import build_model
+
+# The page layout from the original script, plus a {trends} slot that stays
+# empty until there is some history to chart. It is split into
+# literal chunks and placeholders once at import, and the placeholders are
+# filled by streaming row fragments straight into the output file, so the
+# page is never built up as one big string.
+HTML_TEMPLATE = '''
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <title>Fantasy Basketball Results</title>
+        <style>
+            .container {{
+                display: flex;
+                flex-wrap: wrap;
+                justify-content: space-around;
+            }}
+            .row {{
+                display: flex;
+                width: 100%;
+                justify-content: space-around;
+                margin-bottom: 20px;
+            }}
+            table {{
+                width: 50%;
+                border-collapse: collapse;
+                margin: 20px auto;
+                word-wrap: break-word;
+            }}
+            table, th, td {{
+                border: 1px solid black;
+            }}
+            th, td {{
+                padding: 10px;
+                text-align: center;
+                word-break: break-word;
+            }}
+            .ranking-table {{
+                margin: 20px auto;
+                text-align: center;
+            }}
+            h1 {{
+                text-align: center;
+            }}
+            .timestamp {{
+                text-align: left;
+                font-weight: bold;
+                margin: 10px 0;
+            }}
+        </style>
+    </head>
+    <body>
+        <div class="timestamp">
+            <p>Last updated: {timestamp}</p>
+        </div>
+        <div class="ranking-table">
+            <table>
+                <tr>
+                    <th>Owner</th>
+                    <th>Total Points</th>
+                </tr>
+                {ranking_rows}
+            </table>
+        </div>
+        <div class="ranking-table">
+            <h2>Top 5 Teams by Value (Wins - Cost)</h2>
+            <table>
+                <tr>
+                    <th>Owner</th>
+                    <th>Team</th>
+                    <th>Wins</th>
+                    <th>Cost</th>
+                    <th>Value</th>
+                </tr>
+                {value_rows}
+            </table>
+        </div>
+        <div class="ranking-table">
+            <h2>Most Wins with Cost ≤ 1</h2>
+            <table>
+                <tr>
+                    <th>Owner</th>
+                    <th>Team</th>
+                    <th>Wins</th>
+                    <th>Cost</th>
+                </tr>
+                {low_cost_rows}
+            </table>
+        </div>
+        {trends}
+        <h1>Rankings</h1>
+        <div class="container">
+            {owner_tables}
+        </div>
+    </body>
+    </html>
+    '''
+
+
+# [(literal text, placeholder name or None), ...]. The parser splits the
+# text at every {{ }} escape too, so neighbouring literals are joined back up.
+def _compile_template(template):
+    parts = []
+    literal_run = ""
+    for literal, field, _, _ in string.Formatter().parse(template):
+        literal_run += literal
+        if field is not None:
+            parts.append((literal_run, field))
+            literal_run = ""
+    parts.append((literal_run, None))
+    return parts
+
+
+TEMPLATE_PARTS = _compile_template(HTML_TEMPLATE)
+
+
+def _minify_css(match):
+    css = re.sub(r"\s+", " ", match.group(2))
+    css = re.sub(r"\s*([{}:;,])\s*", r"\1", css).replace(";}", "}")
+    return match.group(1) + css.strip() + match.group(3)
+
+
+# Drop the indentation and line breaks between tags and squeeze the CSS
+def _minify(literal):
+    literal = re.sub(r"(<style>)(.*?)(</style>)", _minify_css, literal, flags=re.S)
+    literal = re.sub(r">\s+<", "><", literal)
+    literal = re.sub(r"^\s+<", "<", literal)
+    return re.sub(r">\s+$", ">", literal)
+
+
+# Same template without the whitespace, for the minified output mode
+MINIFIED_TEMPLATE_PARTS = [(_minify(literal), field) for literal, field in TEMPLATE_PARTS]
+
+WRITE_BUFFER_SIZE = 1 << 16
+
+
+def _value_rows(value_leaders):
+    for owner_name, team_name, wins, cost, value in value_leaders:
+        yield f"<tr><td>{owner_name}</td><td>{team_name}</td><td>{wins}</td><td>{cost:.2f}</td><td>{value:.2f}</td></tr>"
+
+
+def _low_cost_rows(low_cost_leaders):
+    for owner_name, team_name, wins, cost in low_cost_leaders:
+        yield f"<tr><td>{owner_name}</td><td>{team_name}</td><td>{wins}</td><td>{cost:.2f}</td></tr>"
+
+
+def _ranking_rows(owners):
+    for owner in owners:
+        yield f"<tr><td>{owner.name}</td><td>{owner.total}</td></tr>"
+
+
+# One owner's <table>; place is "1st", "2nd", "3rd" or ""
+def owner_table(owner_name, teams, place):
+    total_points = sum([team[1] for team in teams])
+    place = f" ({place})" if place else ""
+
+    parts = [f"<table><caption><h2>{owner_name}{place}</h2></caption>",
+             "<tr><th>Teams</th><th>Points</th><th>Cost</th></tr>"]
+    for team_name, points, cost in teams:
+        parts.append(f"<tr><td class='team-col'>{team_name}</td><td class='points-col'>{points}</td><td class='cost-col'>{cost}</td></tr>")
+
+    total_points = str(total_points)[:3]
+    parts.append(f"<tr><td>Total</td><td>{total_points}</td><td>-</td></tr>")
+    parts.append("</table>")
+    return "".join(parts)
+
+
+SPARKLINE_WIDTH = 120
+SPARKLINE_HEIGHT = 24
+
+
+# A small inline SVG line chart. lowest/highest fix the vertical scale;
+# invert puts the lowest value at the top (rank 1 is best).
+def sparkline(values, lowest=None, highest=None, invert=False):
+    lowest = min(values) if lowest is None else lowest
+    highest = max(values) if highest is None else highest
+    spread = (highest - lowest) or 1
+    step = SPARKLINE_WIDTH / max(len(values) - 1, 1)
+
+    points = []
+    for i, value in enumerate(values):
+        level = (value - lowest) / spread
+        y = level if invert else 1 - level
+        points.append(f"{i * step:.1f},{1 + y * (SPARKLINE_HEIGHT - 2):.1f}")
+
+    return (f"<svg width='{SPARKLINE_WIDTH}' height='{SPARKLINE_HEIGHT}' viewBox='0 0 {SPARKLINE_WIDTH} {SPARKLINE_HEIGHT}'>"
+            f"<polyline fill='none' stroke='black' stroke-width='1.5' points='{' '.join(points)}'/></svg>")
+
+
+# Points and rank over the recorded runs, one row per owner in ranking order
+def _trends(owners, trends):
+    if not trends or len(next(iter(trends.values()))[0]) < 2:
+        return
+
+    yield "<div class='ranking-table'><h2>Trends</h2><table>"
+    yield "<tr><th>Owner</th><th>Points</th><th>Rank</th></tr>"
+    for owner in owners:
+        totals, ranks = trends[owner.owner]
+        yield (f"<tr><td>{owner.name}</td><td>{sparkline(totals)}</td>"
+               f"<td>{sparkline(ranks, 1, len(owners), invert=True)} {ranks[-1]}</td></tr>")
+    yield "</table></div>"
+
+
+# Owner tables three to a row
+def _owner_tables(owners):
+    owner_counter = 0
+    for owner in owners:
+        if owner_counter % 3 == 0:
+            yield "<div class='row'>"
+        yield owner_table(owner.name, owner.teams, owner.place)
+        if owner_counter % 3 == 2:
+            yield "</div>"
+        owner_counter += 1
+
+    if owner_counter % 3 != 0:
+        yield "</div>"
+
+
+# Placeholders whose text changes every run without the standings changing
+VOLATILE_FIELDS = {"timestamp"}
+VOLATILE_MARKER = b"Last updated: "
+READ_CHUNK_SIZE = 1 << 16
+
+
+# Passes writes through while hashing everything except the volatile fields
+class _HashingWriter:
+    def __init__(self, f):
+        self.f = f
+        self.sha = hashlib.sha256()
+
+    def write(self, text):
+        self.f.write(text)
+        self.sha.update(text.encode("utf-8"))
+
+    def write_volatile(self, text):
+        self.f.write(text)
+
+    def hexdigest(self):
+        return self.sha.hexdigest()
+
+
+# Hash of a page already on disk, ignoring the "Last updated" time. The file
+# is hashed a chunk at a time, so only a chunk or two is ever in memory.
+def page_content_hash(path):
+    sha = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            # Hash up to the timestamp, skip it, then hash the rest as it comes
+            pending = b""
+            for chunk in iter(lambda: f.read(READ_CHUNK_SIZE), b""):
+                pending += chunk
+                start = pending.find(VOLATILE_MARKER)
+                if start < 0:
+                    # Keep a tail in case the marker straddles two chunks
+                    cut = max(len(pending) - len(VOLATILE_MARKER) + 1, 0)
+                    sha.update(pending[:cut])
+                    pending = pending[cut:]
+                    continue
+
+                end = pending.find(b"<", start)
+                if end >= 0:
+                    sha.update(pending[:start + len(VOLATILE_MARKER)])
+                    pending = pending[end:]
+                    break
+            else:
+                # A page cut off in the middle of the timestamp
+                start = pending.find(VOLATILE_MARKER)
+                if start >= 0:
+                    pending = pending[:start + len(VOLATILE_MARKER)]
+            sha.update(pending)
+
+            for chunk in iter(lambda: f.read(READ_CHUNK_SIZE), b""):
+                sha.update(chunk)
+    except OSError:
+        return None
+    return sha.hexdigest()
+
+
+# Write the template to f, pulling each placeholder's text from fragments
+def write_template(f, fragments, parts=TEMPLATE_PARTS):
+    for literal, field in parts:
+        f.write(literal)
+        if field is None:
+            continue
+
+        value = fragments[field]
+        if field in VOLATILE_FIELDS:
+            getattr(f, "write_volatile", f.write)(value)
+        elif isinstance(value, str):
+            f.write(value)
+        else:
+            for chunk in value:
+                f.write(chunk)
+
+
+# Render the standings page from a RenderModel. Returns True if the page was
+# rewritten.
+def write_html(model, output_path="index.html", minify=False):
+    fragments = {
+        "timestamp": model.timestamp,
+        "ranking_rows": _ranking_rows(model.owners),
+        "value_rows": _value_rows(model.value_leaders),
+        "low_cost_rows": _low_cost_rows(model.low_cost_leaders),
+        "owner_tables": _owner_tables(model.owners),
+        "trends": _trends(model.owners, model.trends),
+    }
+
+    # Only replace the page when more than the timestamp changed, and never
+    # leave a half-written page behind
+    with AtomicFile(output_path, buffering=WRITE_BUFFER_SIZE) as f:
+        writer = _HashingWriter(f)
+        write_template(writer, fragments, MINIFIED_TEMPLATE_PARTS if minify else TEMPLATE_PARTS)
+        changed = writer.hexdigest() != page_content_hash(output_path)
+        if not changed:
+            f.discard()
+
+    if not changed:
+        print(f"Standings unchanged, '{output_path}' left as it was.")
+        return False
+
+    print(f"Results have been saved to '{output_path}'.")
+    return True
+
+
+# Render the standings page for a league
+def generate_html_output(owner_teams, owner_totals, owner_names, output_path="index.html", timestamp=None,
+                         minify=False):
+    model = build_model(owner_teams, owner_totals, owner_names, timestamp)
+    return write_html(model, output_path, minify)
@@ -0,0 +1,56 @@
+from datetime import datetime
+
+from leaderboards import LOW_COST_LEADERS, VALUE_LEADERS, team_rows
+
+# What every output format shows, worked out once per run: the ranking,
+# place labels, leaderboards and each owner's rows. The HTML page, JSON
+# feed, CSV and Markdown writers (output_writers.py) all read from one
+# RenderModel instead of each re-ranking the owners.
+#
+#   model.owners            [RankedOwner, ...], best first
+#   model.value_leaders     [(owner name, team, wins, cost, value), ...]
+#   model.low_cost_leaders  [(owner name, team, wins, cost), ...]
+#   model.trends            {owner id: (totals, ranks)} from history.py,
+#                           oldest run first, or None
+
+PLACE_LABELS = {0: "1st", 1: "2nd", 2: "3rd"}
+
+
+def timestamp_now():
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+class RankedOwner:
+    __slots__ = ("owner", "name", "total", "place", "teams")
+
+    def __init__(self, owner, name, total, place, teams):
+        self.owner = owner
+        self.name = name
+        self.total = total
+        # "1st", "2nd", "3rd" or ""
+        self.place = place
+        # [(team, wins, cost), ...] in roster order
+        self.teams = teams
+
+
+class RenderModel:
+    def __init__(self, timestamp, owners, value_leaders, low_cost_leaders, trends=None):
+        self.timestamp = timestamp
+        self.owners = owners
+        self.value_leaders = value_leaders
+        self.low_cost_leaders = low_cost_leaders
+        self.trends = trends
+
+
+def build_model(owner_teams, owner_totals, owner_names, timestamp=None, trends=None):
+    sorted_owners = sorted(owner_totals.items(), key=lambda x: x[1], reverse=True)
+    owners = [
+        RankedOwner(owner, owner_names[owner], total, PLACE_LABELS.get(i, ""), owner_teams[owner])
+        for i, (owner, total) in enumerate(sorted_owners)
+    ]
+
+    rows = team_rows(owner_teams)
+    value_leaders = [(owner_names[row[0]],) + row[1:] for row in VALUE_LEADERS.rows(rows)]
+    low_cost_leaders = [(owner_names[row[0]],) + row[1:4] for row in LOW_COST_LEADERS.rows(rows)]
+
+    return RenderModel(timestamp or timestamp_now(), owners, value_leaders, low_cost_leaders, trends)
@@ -0,0 +1,55 @@
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+from fetcher import BASE_URL, fetch_seasons
+from league import list_leagues, load_league
+from league_engine import MATRIX_MIN_OWNERS, match_schools, render_league, score_league, score_league_matrix
+
+# Score and render every league from one fetch per season. Leagues that share
+# a season share its standings; rendering can be spread over processes.
+# Big leagues are scored with the matrix engine when numpy is installed.
+
+
+def run_all_leagues(league_keys=None, jobs=1, base_url=BASE_URL):
+    leagues = [load_league(key) for key in (league_keys or list_leagues())]
+    if not leagues:
+        print("No leagues configured.")
+        return
+
+    seasons = sorted({league.season for league in leagues})
+    print(f"Fetching {len(seasons)} season(s) for {len(leagues)} league(s)...")
+    standings = fetch_seasons(seasons, base_url)
+
+    # Scoring updates each league's saved state, so it stays in this process
+    renders = []
+    for league in leagues:
+        teams_and_wins = standings.get(league.season)
+        if not teams_and_wins:
+            print(f"{league.name}: no standings available, leaving '{league.output}' untouched.")
+            continue
+
+        teams_and_wins = match_schools(league, teams_and_wins)
+        scored = None
+        if len(league.rosters) >= MATRIX_MIN_OWNERS:
+            scored = score_league_matrix(league, teams_and_wins)
+        owner_teams, owner_totals = scored or score_league(league, teams_and_wins)
+        renders.append((league, owner_teams, owner_totals))
+
+    if jobs > 1 and len(renders) > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(renders))) as pool:
+            for future in [pool.submit(render_league, *args) for args in renders]:
+                future.result()
+    else:
+        for args in renders:
+            render_league(*args)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Score every configured league from one fetch per season.")
+    parser.add_argument("leagues", nargs="*", help="league files or names from leagues/ (default: all of them)")
+    parser.add_argument("--jobs", type=int, default=1, help="render pages in this many processes")
+    parser.add_argument("--base-url", default=BASE_URL,
+                        help="where the <season>-school-stats.html pages live (e.g. a local http.server)")
+    args = parser.parse_args()
+
+    run_all_leagues(args.leagues, args.jobs, args.base_url)
@@ -1,45 +1,48 @@
-import subprocess
-import time
+import argparse
 import os
+import sys
 
-# Step 1: Run the existing fantasy basketball program
-def run_fantasy_basketball_script():
-    print("Running the fantasy basketball game script...")
-    subprocess.run(["python", "fantasy_basketball_game.py"], check=True)
+from daemon import run_daemon
+from fantasy_basketball_game import LEAGUE
+from league import load_league
+from pipeline import Pipeline
+from publisher import GitPublisher
 
-# Step 2: Wait for 1 minute
-def wait_one_minute():
-    print("Waiting for 1 minute...")
-    time.sleep(60)
+REPO_DIRECTORY = r"C:\Users\brand\Desktop\FantasyBasketball\BrandonRiv.github.io"  # FIXED PATH
 
-# Step 3: Add, commit, and push changes to GitHub
-def push_to_github():
-    repo_directory = r"C:\Users\brand\Desktop\FantasyBasketball\BrandonRiv.github.io"  # FIXED PATH
-    os.chdir(repo_directory)
+# Fetch, score and render in this process, then commit the rewritten files
+# as soon as they are on disk and push them in the background. Nothing is
+# committed when the standings didn't change.
+# With --daemon it keeps running and updates on daemon.py's schedule.
 
-    print("Adding changes to git...")
-    subprocess.run(["git", "add", "."], check=True)
-
-    print("Committing changes...")
-    # SAFE COMMIT: won't crash if no changes
-    subprocess.run(
-        ["git", "commit", "-m", "Automated commit after running fantasy basketball game script", "--allow-empty"],
-        check=True
-    )
-
-    print("Pushing to GitHub...")
-    subprocess.run(["C:/Program Files/Git/bin/git.exe", "push"], check=True)
+# git used for pushing, where the GitHub credentials are set up
+GIT_PUSH = ["C:/Program Files/Git/bin/git.exe", "push"]
 
 def main():
-    # Navigate to repo first
-    repo_directory = r"C:\Users\brand\Desktop\FantasyBasketball\BrandonRiv.github.io"
-    os.chdir(repo_directory)
+    parser = argparse.ArgumentParser(description="Update the standings page and push it to GitHub.")
+    parser.add_argument("--daemon", action="store_true", help="keep running and update on a schedule")
+    args = parser.parse_args()
 
-    run_fantasy_basketball_script()
-    wait_one_minute()
-    push_to_github()
-
-    print("Script execution completed and changes pushed to GitHub.")
+    # Navigate to repo first
+    os.chdir(REPO_DIRECTORY)
+
+    publisher = GitPublisher(push_command=GIT_PUSH)
+    try:
+        if args.daemon:
+            run_daemon([LEAGUE], publish=publisher.publish)
+            return
+
+        print("Running the fantasy basketball game...")
+        pipeline = Pipeline(load_league(LEAGUE), publish=publisher.publish)
+        if pipeline.run():
+            print("Script execution completed, waiting for the push to GitHub...")
+    finally:
+        # Let a queued push finish before exiting
+        publisher.close()
+
+    # A failed fetch, render or commit should fail the scheduled task
+    if "failed" in pipeline.status.values():
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,155 @@
+import difflib
+import json
+import os
+import re
+
+# Maps the school names on our rosters to the names on the stats page.
+# Lookups go through tiers, each tried only when the one before fails:
+#   exact       the roster name is on the page as-is
+#   alias       a known nickname (VCU, UNLV, ...) from ALIASES
+#   normalized  same name once case, punctuation and "&"/"and" are ignored
+#   fuzzy       closest page name by difflib, resolved once and cached
+# After build() every roster school is resolved, so lookups are a dict get.
+FUZZY_CACHE_FILE = os.path.join(".cache", "school_matches.json")
+FUZZY_CUTOFF = 0.85
+# A fuzzy match this close to the runner-up is reported instead of guessed
+FUZZY_MARGIN = 0.05
+
+ALIASES = {
+    "byu": "Brigham Young",
+    "lsu": "Louisiana State",
+    "liu": "Long Island University",
+    "liu brooklyn": "Long Island University",
+    "nebraska omaha": "Omaha",
+    "queens": "Queens (NC)",
+    "smu": "Southern Methodist",
+    "st josephs": "Saint Joseph's",
+    "st thomas mn": "St. Thomas",
+    "tennessee martin": "Tennessee-Martin",
+    "unlv": "Nevada-Las Vegas",
+    "usc": "Southern California",
+    "vcu": "Virginia Commonwealth",
+}
+
+
+def normalize(name):
+    name = name.strip()
+    if name.endswith("NCAA"):
+        name = name[:-4]
+    name = name.lower().replace("&", " and ").replace("-", " ")
+    name = re.sub(r"[.'(),]", "", name)
+    return " ".join(name.split())
+
+
+def _load_fuzzy_cache():
+    try:
+        with open(FUZZY_CACHE_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_fuzzy_cache(cache):
+    os.makedirs(os.path.dirname(FUZZY_CACHE_FILE), exist_ok=True)
+    tmp_file = FUZZY_CACHE_FILE + ".tmp"
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        json.dump(cache, f, indent=1, sort_keys=True)
+    os.replace(tmp_file, FUZZY_CACHE_FILE)
+
+
+class SchoolIndex:
+    def __init__(self, page_names):
+        self.page_names = set(page_names)
+
+        # normalized -> page name; None marks two page names colliding
+        self.normalized = {}
+        for page_name in self.page_names:
+            key = normalize(page_name)
+            self.normalized[key] = None if key in self.normalized else page_name
+
+        self.resolved = {}
+        self.tiers = {}
+        self.unmatched = []
+        self.ambiguous = {}
+
+    def _fuzzy(self, name, cache):
+        # Only compare names that start with the same word, so a missing
+        # "Arkansas State" can't turn into "Kansas State"
+        key = normalize(name)
+        first_word = key.split(" ", 1)[0]
+
+        # Cached matches pass the same check, which drops any saved before it
+        cached = cache.pop(name, None)
+        if cached in self.page_names and normalize(cached).split(" ", 1)[0] == first_word:
+            cache[name] = cached
+            return cached, None
+
+        scores = sorted(
+            ((difflib.SequenceMatcher(None, key, other).ratio(), page_name)
+             for other, page_name in self.normalized.items()
+             if page_name and other.split(" ", 1)[0] == first_word),
+            reverse=True,
+        )
+        if not scores or scores[0][0] < FUZZY_CUTOFF:
+            return None, None
+
+        close = [page_name for score, page_name in scores if score >= scores[0][0] - FUZZY_MARGIN]
+        if len(close) > 1:
+            return None, close
+
+        cache[name] = scores[0][1]
+        return scores[0][1], None
+
+    # Resolve every roster school up front
+    def build(self, roster_names):
+        cache = _load_fuzzy_cache()
+        cache_before = dict(cache)
+
+        for name in roster_names:
+            if name in self.resolved or name in self.unmatched or name in self.ambiguous:
+                continue
+
+            key = normalize(name)
+            if name in self.page_names:
+                match, tier = name, "exact"
+            elif ALIASES.get(key) in self.page_names:
+                match, tier = ALIASES[key], "alias"
+            elif self.normalized.get(key):
+                match, tier = self.normalized[key], "normalized"
+            else:
+                match, candidates = self._fuzzy(name, cache)
+                tier = "fuzzy"
+                if candidates:
+                    self.ambiguous[name] = candidates
+                    continue
+
+            if match is None:
+                self.unmatched.append(name)
+                continue
+
+            self.resolved[name] = match
+            self.tiers[name] = tier
+
+        if cache != cache_before:
+            _save_fuzzy_cache(cache)
+
+        return self
+
+    def lookup(self, name):
+        return self.resolved.get(name)
+
+    # Re-key standings by roster school name
+    def remap(self, teams_and_wins):
+        return {name: teams_and_wins[page_name] for name, page_name in self.resolved.items()
+                if page_name in teams_and_wins}
+
+    def report(self):
+        lines = []
+        for name, tier in sorted(self.tiers.items()):
+            if tier in ("normalized", "fuzzy"):
+                lines.append(f"  {name} -> {self.resolved[name]} ({tier})")
+        for name in sorted(self.ambiguous):
+            lines.append(f"  {name}: ambiguous, could be {' / '.join(self.ambiguous[name])}")
+        for name in sorted(self.unmatched):
+            lines.append(f"  {name}: no match on the stats page, scoring 0")
+        return lines
@@ -0,0 +1,107 @@
+import numpy as np
+
+# Columnar scoring for big leagues and many scoring variants at once.
+#
+# The rosters become a sparse owner x school incidence matrix in CSR form:
+# owner o holds roster slots indptr[o]:indptr[o + 1], slot s is school
+# indices[s] bought at cost[s]. With a wins vector over the schools, owner
+# totals are one gather plus a segmented sum, team values are a vector
+# subtraction and rankings are an argsort. A wins matrix (schools x variants)
+# scores every variant in the same calls.
+
+
+class LeagueMatrix:
+    def __init__(self, league, schools=None):
+        self.rosters = league.rosters
+        self.owners = list(league.rosters)
+        self.schools = list(schools) if schools is not None else league.schools()
+        self.school_ids = {school: i for i, school in enumerate(self.schools)}
+
+        slot_owner, indices, cost, team_names = [], [], [], []
+        indptr = [0]
+        for o, owner in enumerate(self.owners):
+            for team, school, team_cost in league.rosters[owner]:
+                slot_owner.append(o)
+                indices.append(self.school_ids[school])
+                cost.append(team_cost)
+                team_names.append(team)
+            indptr.append(len(indices))
+
+        self.indptr = np.array(indptr, dtype=np.int64)
+        self.indices = np.array(indices, dtype=np.int64)
+        self.slot_owner = np.array(slot_owner, dtype=np.int64)
+        self.cost = np.array(cost, dtype=np.float64)
+        self.team_names = team_names
+
+    # Wins over self.schools from a {school: wins} dict, 0 when missing
+    def wins_vector(self, teams_and_wins):
+        return np.array([teams_and_wins.get(school, 0) for school in self.schools], dtype=np.int64)
+
+    # owner_teams ({owner: [(team, wins, cost), ...]}) and owner_totals
+    # (best first), the same as league_engine.score_league returns
+    def score(self, teams_and_wins):
+        wins = self.wins_vector(teams_and_wins)
+        slot_wins = self.slot_wins(wins).tolist()
+        indptr = self.indptr.tolist()
+        owner_teams = {
+            owner: [(team, team_wins, cost) for (team, _, cost), team_wins
+                    in zip(self.rosters[owner], slot_wins[indptr[o]:indptr[o + 1]])]
+            for o, owner in enumerate(self.owners)
+        }
+        return owner_teams, dict(self.ranking(wins))
+
+    # Wins of every roster slot
+    def slot_wins(self, wins):
+        return wins[self.indices]
+
+    # Owner totals: the incidence matrix times the wins vector
+    def totals(self, wins):
+        return np.add.reduceat(self.slot_wins(wins), self.indptr[:-1], axis=0)
+
+    # wins - cost for every roster slot
+    def values(self, wins):
+        slot_wins = self.slot_wins(wins)
+        if slot_wins.ndim == 2:
+            return slot_wins - self.cost[:, None]
+        return slot_wins - self.cost
+
+    # [(owner, total), ...] best first, ties in roster order like sorted() did
+    def ranking(self, wins):
+        totals = self.totals(wins)
+        order = np.argsort(-totals, kind="stable")
+        return [(self.owners[o], int(totals[o])) for o in order]
+
+    # The k best slots by score (highest first, earlier slot wins ties),
+    # optionally only among slots where mask is True. Uses a partial
+    # selection so only the winners get sorted.
+    def top_slots(self, scores, k, mask=None):
+        candidates = np.arange(len(scores)) if mask is None else np.flatnonzero(mask)
+        if k <= 0 or len(candidates) == 0:
+            return []
+
+        candidate_scores = scores[candidates]
+        if len(candidates) > k:
+            kth = np.partition(candidate_scores, len(candidates) - k)[len(candidates) - k]
+            keep = candidate_scores >= kth
+            candidates = candidates[keep]
+            candidate_scores = candidate_scores[keep]
+
+        order = np.lexsort((candidates, -candidate_scores))[:k]
+        return candidates[order].tolist()
+
+    # (owner, team, wins, cost) for each slot
+    def slot_rows(self, slots, wins):
+        slot_wins = self.slot_wins(wins)
+        return [
+            (self.owners[self.slot_owner[s]], self.team_names[s], int(slot_wins[s]), float(self.cost[s]))
+            for s in slots
+        ]
+
+    # The two leaderboards on the standings page
+    def top_values(self, wins, k=5):
+        values = self.values(wins)
+        return [row + (row[2] - row[3],) for row in self.slot_rows(self.top_slots(values, k), wins)]
+
+    def top_low_cost(self, wins, k=5, max_cost=1):
+        slots = self.top_slots(self.slot_wins(wins), k, mask=self.cost <= max_cost)
+        return self.slot_rows(slots, wins)
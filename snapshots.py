@@ -0,0 +1,95 @@
+import gzip
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+
+# Content-addressed archive of every stats page we fetch.
+# Pages live in snapshots/<sha256>.html.gz, and index.jsonl records one line
+# per fetch (hash, fetch time, season url) so repeats of an unchanged page
+# only cost an index line.
+SNAPSHOT_DIR = "snapshots"
+INDEX_FILE = os.path.join(SNAPSHOT_DIR, "index.jsonl")
+
+_index_lock = threading.Lock()
+
+
+def _snapshot_path(page_hash):
+    return os.path.join(SNAPSHOT_DIR, f"{page_hash}.html.gz")
+
+
+def page_hash(content):
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return hashlib.sha256(content).hexdigest()
+
+
+# Archive a fetched page and return its hash
+def save_snapshot(url, content, fetched_at=None):
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+
+    digest = page_hash(content)
+    fetched_at = fetched_at or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+    path = _snapshot_path(digest)
+    if not os.path.exists(path):
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with gzip.open(tmp_path, "wb", compresslevel=9) as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+
+    with _index_lock:
+        with open(INDEX_FILE, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"hash": digest, "fetched_at": fetched_at, "url": url}) + "\n")
+
+    return digest
+
+
+# Every recorded fetch, oldest first
+def list_snapshots():
+    entries = []
+    try:
+        with open(INDEX_FILE, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    entries.append(json.loads(line))
+    except OSError:
+        pass
+    return entries
+
+
+# Find the index entry for a hash (or unique hash prefix), latest fetch wins
+def find_snapshot(ref):
+    matches = [entry for entry in list_snapshots() if entry["hash"].startswith(ref)]
+    if not matches:
+        return None
+
+    if len({entry["hash"] for entry in matches}) > 1:
+        print(f"Snapshot prefix '{ref}' is ambiguous.")
+        return None
+
+    return matches[-1]
+
+
+# Load an archived page by hash, hash prefix or file path.
+# Returns (page bytes, index entry) or (None, None) if it can't be found.
+def load_snapshot(ref):
+    if os.path.isfile(ref):
+        opener = gzip.open if ref.endswith(".gz") else open
+        with opener(ref, "rb") as f:
+            content = f.read()
+        entry = find_snapshot(page_hash(content)) or {"hash": page_hash(content), "fetched_at": None, "url": None}
+        return content, entry
+
+    entry = find_snapshot(ref)
+    if not entry:
+        print(f"No snapshot found for '{ref}'.")
+        return None, None
+
+    with gzip.open(_snapshot_path(entry["hash"]), "rb") as f:
+        content = f.read()
+
+    return content, entry
@@ -0,0 +1,103 @@
+import mmap
+import os
+import struct
+from array import array
+
+from snapshots import page_hash
+from stats_parser import STAT_COLUMNS, parse_school_stats
+
+# Parsed standings stored per page hash in .cache/standings/<sha256>.bin so an
+# identical page never gets parsed twice.
+#
+# File layout (little-endian):
+#   header    "STND" magic, u16 version, u16 column count, u32 school count,
+#             u32 byte length of the names block
+#   columns   one 16-byte NUL-padded stat name per column
+#   data      int16[column count][school count], school i is index i
+#   names     UTF-8 school names joined with "\n"
+STORE_DIR = os.path.join(".cache", "standings")
+MAGIC = b"STND"
+VERSION = 1
+HEADER = struct.Struct("<4sHHII")
+NAME_WIDTH = 16
+
+INT_COLUMNS = tuple(stat for stat, typecode in STAT_COLUMNS.items() if typecode == "h")
+
+
+def _store_path(digest):
+    return os.path.join(STORE_DIR, f"{digest}.bin")
+
+
+def save_standings(digest, stats):
+    columns = [stat for stat in INT_COLUMNS if stat in stats]
+    schools = stats["school_name"]
+    names = "\n".join(schools).encode("utf-8")
+
+    parts = [HEADER.pack(MAGIC, VERSION, len(columns), len(schools), len(names))]
+    for stat in columns:
+        parts.append(stat.encode("ascii").ljust(NAME_WIDTH, b"\0"))
+    for stat in columns:
+        parts.append(array("h", stats[stat]).tobytes())
+    parts.append(names)
+
+    os.makedirs(STORE_DIR, exist_ok=True)
+    path = _store_path(digest)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(b"".join(parts))
+    os.replace(tmp_path, path)
+
+
+# Load standings saved for a page hash, or None if we don't have them
+def load_standings(digest):
+    try:
+        f = open(_store_path(digest), "rb")
+    except OSError:
+        return None
+
+    with f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        magic, version, n_columns, n_schools, names_length = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            return None
+
+        offset = HEADER.size
+        columns = []
+        for _ in range(n_columns):
+            columns.append(data[offset:offset + NAME_WIDTH].rstrip(b"\0").decode("ascii"))
+            offset += NAME_WIDTH
+
+        stats = {}
+        column_bytes = n_schools * 2
+        for stat in columns:
+            values = array("h")
+            values.frombytes(data[offset:offset + column_bytes])
+            stats[stat] = values
+            offset += column_bytes
+
+        names = data[offset:offset + names_length].decode("utf-8")
+        stats["school_name"] = names.split("\n") if n_schools else []
+
+    return stats
+
+
+# Standings for a fetched page: from the store when this exact page has been
+# parsed before, otherwise parsed once and stored for next time.
+def standings_for_page(content):
+    digest = page_hash(content)
+
+    stats = load_standings(digest)
+    if stats is not None:
+        return stats
+
+    stats = parse_school_stats(content, INT_COLUMNS)
+    if stats:
+        save_standings(digest, stats)
+    return stats
+
+
+def teams_and_wins_for_page(content):
+    stats = standings_for_page(content)
+    if not stats:
+        return {}
+
+    return dict(zip(stats["school_name"], stats["wins"]))
@@ -0,0 +1,182 @@
+from array import array
+
+TABLE_ID = "basic_school_stats"
+
+
+# Turn the rows of the stats table into {school name: overall wins}
+def _rows_to_teams_and_wins(table):
+    teams_and_wins = {}
+    for row in table.find('tbody').find_all('tr'):
+        cells = row.find_all('td')
+        if len(cells) > 2:
+            school_name = cells[0].text.strip()
+            overall_wins = cells[2].text.strip()
+
+            if school_name.endswith('NCAA'):
+                school_name = school_name[:-4].strip()
+
+            if overall_wins.isdigit():
+                teams_and_wins[school_name] = int(overall_wins)
+
+    return teams_and_wins
+
+
+# Original extractor: builds a tree of the whole page, kept for benchmarking
+def parse_teams_and_wins_full(content):
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(content, 'html.parser')
+    table = soup.find('table', {'id': TABLE_ID})
+
+    if not table:
+        print("Could not find the table on the page.")
+        return {}
+
+    return _rows_to_teams_and_wins(table)
+
+
+# Cut the raw page down to just the <table id="basic_school_stats"> markup
+def _slice_table(content):
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+
+    marker = content.find(f'id="{TABLE_ID}"'.encode())
+    if marker == -1:
+        return None
+
+    start = content.rfind(b"<table", 0, marker)
+    end = content.find(b"</table>", marker)
+    if start == -1 or end == -1:
+        return None
+
+    return content[start:end + len(b"</table>")]
+
+
+# Find the stats table in a page, only ever turning the table into tags.
+# bs4 is imported when a page actually has to be parsed; standings already
+# in the standings store never load it.
+def find_stats_table(content):
+    from bs4 import BeautifulSoup, SoupStrainer
+
+    only_table = SoupStrainer('table', id=TABLE_ID)
+
+    # Parsing just the table slice is where the savings come from; if the
+    # slice can't be found the strainer still keeps the rest of the page
+    # out of the tree.
+    table_markup = _slice_table(content)
+    if table_markup is None:
+        table_markup = content
+
+    soup = BeautifulSoup(table_markup, 'html.parser', parse_only=only_table)
+    table = soup.find('table', {'id': TABLE_ID})
+
+    if not table:
+        print("Could not find the table on the page.")
+    return table
+
+
+# Map each column's data-stat name to its position, from the last <thead> row
+# (the one above it only holds the "Overall"/"Conf." group headings)
+def column_map(table):
+    thead = table.find('thead')
+    if not thead:
+        return {}
+
+    header_rows = thead.find_all('tr')
+    if not header_rows:
+        return {}
+
+    columns = {}
+    for i, cell in enumerate(header_rows[-1].find_all(['th', 'td'])):
+        stat = cell.get('data-stat')
+        if stat and stat not in columns:
+            columns[stat] = i
+    return columns
+
+
+def _to_int(text):
+    return int(text) if text.isdigit() else 0
+
+
+def _to_float(text):
+    try:
+        return float(text)
+    except ValueError:
+        return float("nan")
+
+
+# Columns we know how to extract, with the array typecode they are stored in
+# ('h' = int16 counts, 'd' = float ratings)
+STAT_COLUMNS = {
+    "wins": "h",
+    "losses": "h",
+    "srs": "d",
+    "sos": "d",
+    "wins_conf": "h",
+    "losses_conf": "h",
+}
+
+
+# Extract school names plus the requested stat columns in one pass over the
+# table. Returns {"school_name": [...], "<stat>": array, ...}, or {} if the
+# table is missing or no longer has the columns we need.
+def parse_school_stats(content, stats=("wins",)):
+    # A typo in stats is a bug in the caller, not a change to the page
+    unknown = [stat for stat in stats if stat not in STAT_COLUMNS]
+    if unknown:
+        raise ValueError(f"Don't know how to extract: {', '.join(unknown)}")
+
+    table = find_stats_table(content)
+    if not table:
+        return {}
+
+    columns = column_map(table)
+    missing = [stat for stat in ("school_name", "wins") + tuple(stats) if stat not in columns]
+    if missing:
+        print(f"Stats table layout changed, missing columns: {', '.join(missing)}")
+        return {}
+
+    school_col = columns["school_name"]
+    wins_col = columns["wins"]
+    stat_cols = [(stat, columns[stat], _to_int if STAT_COLUMNS[stat] == "h" else _to_float) for stat in stats]
+    width = max(columns.values()) + 1
+
+    result = {"school_name": []}
+    for stat in stats:
+        result[stat] = array(STAT_COLUMNS[stat])
+
+    for row in table.find('tbody').find_all('tr'):
+        # Repeated header rows inside the body
+        if 'thead' in (row.get('class') or []):
+            continue
+
+        cells = row.find_all(['th', 'td'])
+        if len(cells) < width:
+            continue
+
+        if cells[school_col].get('data-stat') != "school_name":
+            print("Stats table rows no longer line up with the header.")
+            return {}
+
+        # Same rule as before: rows without a win count aren't schools
+        if not cells[wins_col].text.strip().isdigit():
+            continue
+
+        school_name = cells[school_col].text.strip()
+        if school_name.endswith('NCAA'):
+            school_name = school_name[:-4].strip()
+
+        result["school_name"].append(school_name)
+        for stat, i, convert in stat_cols:
+            result[stat].append(convert(cells[i].text.strip()))
+
+    return result
+
+
+# Fast extractor: {school name: overall wins}
+def parse_teams_and_wins(content):
+    stats = parse_school_stats(content)
+    if not stats:
+        return {}
+
+    return dict(zip(stats["school_name"], stats["wins"]))
@@ -0,0 +1,27 @@
+import random
+
+from league import compile_league
+
+COSTS = [0, 0.25, 0.5, 0.75, 1, 1.5, 2, 3, 3.5, 4, 4.5, 5, 6, 7, 8, 9, 10, 12, 14, 20]
+
+
+# A made-up league and standings for scale testing: n_owners owners each
+# drafting teams_per_owner schools out of n_schools.
+# Returns (League, teams_and_wins).
+def synthetic_league(n_owners, n_schools=365, teams_per_owner=10, seed=0):
+    rng = random.Random(seed)
+    schools = [f"School {i}" for i in range(n_schools)]
+
+    owners = []
+    for o in range(n_owners):
+        teams = [
+            {"team": school, "cost": rng.choice(COSTS)}
+            for school in rng.sample(schools, teams_per_owner)
+        ]
+        owners.append({"id": f"Owner {o + 1}", "name": f"Synthetic {o + 1}", "teams": teams})
+
+    data = {"name": f"Synthetic {n_owners}", "season": 2026, "output": "synthetic.html", "owners": owners}
+    league = compile_league(data, f"synthetic-{n_owners}")
+
+    teams_and_wins = {school: rng.randint(0, 35) for school in schools}
+    return league, teams_and_wins